@@ -1,5 +1,4 @@
 import json
-import re
 from datetime import datetime, timedelta, timezone
 
 import gspread
@@ -25,6 +24,8 @@ def upload_call2action(leg_id, env="dev"):
     # Convert date strings to datetime
     df[date_col] = pd.to_datetime(df[date_col])
     curr_date = datetime.strptime(curr_date, "%m-%d-%Y")
+    # Partition rows by meeting date once instead of re-filtering for each day
+    date_groups = dict(iter(df.groupby(df[date_col].dt.date)))
 
     credentials_str = get_secret(secret_id="GOOGLE_SHEETS_SERVICE_ACCOUNT")
     credentials = json.loads(credentials_str)
@@ -32,7 +33,7 @@ def upload_call2action(leg_id, env="dev"):
 
     sh = gc.open_by_key(gsheets_id)
     worksheets = sh.worksheets()
-    worksheet_names = [worksheet.title for worksheet in worksheets]
+    worksheets_by_title = {worksheet.title: worksheet for worksheet in worksheets}
 
     worksheet_links = []
 
@@ -42,18 +43,20 @@ def upload_call2action(leg_id, env="dev"):
         worksheet_name = date.strftime("%A (%m/%d/%Y)")
         print(f"Writing data for {worksheet_name}")
 
+        weekday_name = date.strftime("%A")
         curr_date_worksheet = [
-            worksheet_title
-            for worksheet_title in worksheet_names
-            if re.match(f"^{date.strftime('%A')}", worksheet_title)
+            worksheet
+            for worksheet_title, worksheet in worksheets_by_title.items()
+            if worksheet_title.startswith(weekday_name)
         ]
         if len(curr_date_worksheet) <= 0:
-            sh.add_worksheet(date.strftime("%A (%m/%d/%Y)"), rows=1, cols=1)
+            worksheet = sh.add_worksheet(date.strftime("%A (%m/%d/%Y)"), rows=1, cols=1)
         else:
-            sh.worksheet(curr_date_worksheet[0]).update_title(worksheet_name)
+            worksheet = curr_date_worksheet[0]
+            worksheet.update_title(worksheet_name)
         # print(curr_date_worksheet)
 
-        date_df = df[df[date_col].dt.date == date.date()]
+        date_df = date_groups.get(date.date(), df.iloc[0:0])
         print(date_df)
 
         hide = False
@@ -71,14 +74,14 @@ def upload_call2action(leg_id, env="dev"):
         )
 
         if hide:
-            sh.worksheet(worksheet_name).hide()
+            worksheet.hide()
         else:
-            sh.worksheet(worksheet_name).show()
+            worksheet.show()
 
         if not hide:
             worksheet_links.append(
                 {
-                    "link": f'=HYPERLINK("https://docs.google.com/spreadsheets/d/{gsheets_id}/view?gid={sh.worksheet(worksheet_name).id}#gid={sh.worksheet(worksheet_name).id}", "{date.strftime('%A (%m/%d/%Y)')}")'
+                    "link": f'=HYPERLINK("https://docs.google.com/spreadsheets/d/{gsheets_id}/view?gid={worksheet.id}#gid={worksheet.id}", "{date.strftime('%A (%m/%d/%Y)')}")'
                 }
             )
         else:
@@ -1,15 +1,18 @@
-import base64
+import contextlib
 import datetime
-import io
-import json
-import os
+import re
+import tempfile
 import zipfile
 
+import orjson
 import pandas as pd
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from pipelines.utils.utils import (
+    YAML_LOADER,
     bigquery_to_df,
     dataframe_to_bigquery,
     determine_git_environment,
@@ -22,6 +25,93 @@ LEGISCAN_API_KEY = get_secret(secret_id="LEGISCAN_API_KEY")
 PROJECT_ID = get_secret(secret_id="GCP_PROJECT_ID")
 DATASET_ID = "tx_leg_raw_bills"
 ENV = determine_git_environment()
+# Downloaded datasets larger than this are spooled to disk instead of memory
+DATASET_SPOOL_BYTES = 64 * 1024 * 1024
+
+# Shared session so the dataset list and dataset downloads reuse one
+# connection to the LegiScan API, retrying rate limits and server errors
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
+# Legislature number followed by the session, e.g. '89R' or '892'
+_LEG_ID_RE = re.compile(r"^(\d{2})(\w+)$")
+
+# Fixed columns of the bills, people and votes tables. The parsers return
+# plain tuples in this order so the DataFrames are built without per-row dicts.
+BILL_INFO_COLUMNS = (
+    "legiscan_bill_id",
+    "change_hash",
+    "session_id",
+    "session_tag",
+    "session_title",
+    "session_name",
+    "url",
+    "completed",
+    "status",
+    "status_date",
+    "bill_number",
+    "bill_type",
+    "bill_type_id",
+    "body",
+    "body_id",
+    "current_body",
+    "current_body_id",
+    "title",
+    "description",
+    "pending_committee_id",
+    "committee_id",
+    "committee_chamber",
+    "committee_chamber_id",
+    "committee_name",
+)
+PERSON_COLUMNS = (
+    "people_id",
+    "person_hash",
+    "party",
+    "role",
+    "name",
+    "first_name",
+    "middle_name",
+    "last_name",
+    "suffix",
+    "nickname",
+    "district",
+    "votesmart_id",
+    "ballotpedia",
+)
+VOTE_COLUMNS = (
+    "roll_call_id",
+    "legiscan_bill_id",
+    "date",
+    "desc",
+    "legiscan_people_id",
+    "vote_id",
+    "vote_text",
+)
+
+# Nested lists in each bill document and the tables they are loaded into
+BILL_TABLES = {
+    "progress": "progress",
+    "referrals": "referrals",
+    "calendar": "calendar",
+    "amendments": "amendments",
+    "supplements": "supplements",
+    "votes": "bill_votes",
+    "texts": "texts",
+    "subjects": "subjects",
+    "history": "history",
+}
 
 
 ###############################################################################
@@ -32,10 +122,10 @@ def parse_vote(votes):
     Parse vote data from LegiScan API response.
 
     Args:
-        votes (str): JSON string containing vote data
+        votes (bytes): JSON document containing vote data
 
     Returns:
-        list[dict]: List of dictionaries containing parsed vote data with fields:
+        list[tuple]: One tuple per vote, in VOTE_COLUMNS order:
             - roll_call_id: Unique ID for the roll call vote
             - legiscan_bill_id: LegiScan bill ID
             - date: Date of the vote
@@ -44,25 +134,28 @@ def parse_vote(votes):
             - vote_id: ID of the specific vote
             - vote_text: Text representation of the vote (e.g. Yea, Nay)
     """
-    votes_dict = json.loads(votes)
+    votes_dict = orjson.loads(votes)
 
     roll_call = votes_dict["roll_call"]
 
-    votes_list = []
-    for vote in roll_call["votes"]:
-        votes_list.append(
-            {
-                "roll_call_id": roll_call["roll_call_id"],
-                "legiscan_bill_id": roll_call["bill_id"],
-                "date": roll_call["date"],
-                "desc": roll_call["desc"],
-                "legiscan_people_id": vote["people_id"],
-                "vote_id": vote["vote_id"],
-                "vote_text": vote["vote_text"],
-            }
+    # These fields are the same for every vote in the roll call
+    roll_call_id = roll_call["roll_call_id"]
+    bill_id = roll_call["bill_id"]
+    date = roll_call["date"]
+    desc = roll_call["desc"]
+
+    return [
+        (
+            roll_call_id,
+            bill_id,
+            date,
+            desc,
+            vote["people_id"],
+            vote["vote_id"],
+            vote["vote_text"],
         )
-
-    return votes_list
+        for vote in roll_call["votes"]
+    ]
 
 
 def parse_bill(bill_json):
@@ -70,11 +163,12 @@ def parse_bill(bill_json):
     Parse bill data from LegiScan API response.
 
     Args:
-        bill_json (str): JSON string containing bill data
+        bill_json (bytes): JSON document containing bill data
 
     Returns:
         dict: Dictionary containing parsed bill data with keys:
-            - bill_info: Basic bill information
+            - bill_info: Basic bill information, as a tuple in
+              BILL_INFO_COLUMNS order
             - progress: List of bill progress events
             - referrals: List of committee referrals
             - calendar: List of calendar events
@@ -85,105 +179,51 @@ def parse_bill(bill_json):
             - subjects: List of bill subjects
             - history: List of historical events
     """
-    bill_dict = json.loads(bill_json)["bill"]
-
-    # get progress as a list of dicts
-    progress = bill_dict["progress"]
-    for p in progress:
-        p["legiscan_bill_id"] = bill_dict["bill_id"]
-
-    # referrals as list of dicts
-    referrals = bill_dict["referrals"]
-    for r in referrals:
-        r["legiscan_bill_id"] = bill_dict["bill_id"]
-
-    # calendar as list of dicts
-    calendar = bill_dict["calendar"]
-    for c in calendar:
-        c["legiscan_bill_id"] = bill_dict["bill_id"]
-
-    # ammendments as list of dicts
-    amendments = bill_dict["amendments"]
-    for a in amendments:
-        a["legiscan_bill_id"] = bill_dict["bill_id"]
-
-    # supplements as list of dicts
-    supplements = bill_dict["supplements"]
-    for s in supplements:
-        s["legiscan_bill_id"] = bill_dict["bill_id"]
-
-    # votes as list of dicts
-    votes = bill_dict["votes"]
-    for v in votes:
-        v["legiscan_bill_id"] = bill_dict["bill_id"]
-
-    # texts as list of dicts
-    texts = bill_dict["texts"]
-    for t in texts:
-        t["legiscan_bill_id"] = bill_dict["bill_id"]
-
-    # subjects as list of dicts
-    subjects = bill_dict["subjects"]
-    for s in subjects:
-        s["legiscan_bill_id"] = bill_dict["bill_id"]
-
-    # authors as list of dicts
-    authors = bill_dict["sponsors"]
-    for a in authors:
-        a["legiscan_bill_id"] = bill_dict["bill_id"]
-
-    # history as list of dicts
-    history = bill_dict["history"]
-    for h in history:
-        h["legiscan_bill_id"] = bill_dict["bill_id"]
-
-    # Create dict to store bill info
-    bill_info = {
-        "legiscan_bill_id": bill_dict["bill_id"],
-        "change_hash": bill_dict["change_hash"],
-        "session_id": bill_dict["session_id"],
-        "session_tag": bill_dict["session"]["session_tag"],
-        "session_title": bill_dict["session"]["session_title"],
-        "session_name": bill_dict["session"]["session_name"],
-        "url": bill_dict["url"],
-        "completed": bill_dict["completed"],
-        "status": bill_dict["status"],
-        "status_date": bill_dict["status_date"],
-        "bill_number": bill_dict["bill_number"],
-        "bill_type": bill_dict["bill_type"],
-        "bill_type_id": bill_dict["bill_type_id"],
-        "body": bill_dict["body"],
-        "body_id": bill_dict["body_id"],
-        "current_body": bill_dict["current_body"],
-        "current_body_id": bill_dict["current_body_id"],
-        "title": bill_dict["title"],
-        "description": bill_dict["description"],
-        "pending_committee_id": bill_dict["pending_committee_id"],
-    }
-
-    # Add committee info if exists
-    if "committee" in bill_dict and bill_dict["committee"]:
-        bill_info.update(
-            {
-                "committee_id": bill_dict["committee"]["committee_id"],
-                "committee_chamber": bill_dict["committee"]["chamber"],
-                "committee_chamber_id": bill_dict["committee"]["chamber_id"],
-                "committee_name": bill_dict["committee"]["name"],
-            }
-        )
+    bill_dict = orjson.loads(bill_json)["bill"]
+
+    # Committee info is only present while the bill is in committee
+    committee = bill_dict.get("committee") or {}
+
+    bill_info = (
+        bill_dict["bill_id"],
+        bill_dict["change_hash"],
+        bill_dict["session_id"],
+        bill_dict["session"]["session_tag"],
+        bill_dict["session"]["session_title"],
+        bill_dict["session"]["session_name"],
+        bill_dict["url"],
+        bill_dict["completed"],
+        bill_dict["status"],
+        bill_dict["status_date"],
+        bill_dict["bill_number"],
+        bill_dict["bill_type"],
+        bill_dict["bill_type_id"],
+        bill_dict["body"],
+        bill_dict["body_id"],
+        bill_dict["current_body"],
+        bill_dict["current_body_id"],
+        bill_dict["title"],
+        bill_dict["description"],
+        bill_dict["pending_committee_id"],
+        committee.get("committee_id"),
+        committee.get("chamber"),
+        committee.get("chamber_id"),
+        committee.get("name"),
+    )
 
+    # The nested lists are returned as-is; parse_dataset stamps their rows with
+    # legiscan_bill_id once per table
     return {
         "bill_info": bill_info,
-        "progress": progress,
-        "referrals": referrals,
-        "calendar": calendar,
-        "amendments": amendments,
-        "supplements": supplements,
-        "votes": votes,
-        "texts": texts,
-        "subjects": subjects,
-        # 'authors': authors,
-        "history": history,
+        "progress": bill_dict["progress"],
+        "referrals": bill_dict["referrals"],
+        "calendar": bill_dict["calendar"],
+        "amendments": bill_dict["amendments"],
+        "supplements": bill_dict["supplements"],
+        "votes": bill_dict["votes"],
+        "texts": bill_dict["texts"],
+        "subjects": bill_dict["subjects"],
+        "history": bill_dict["history"],
     }
 
 
@@ -192,10 +232,10 @@ def parse_person(person_json):
     Parse legislator data from LegiScan API response.
 
     Args:
-        person_json (str): JSON string containing legislator data
+        person_json (bytes): JSON document containing legislator data
 
     Returns:
-        dict: Dictionary containing parsed legislator data with fields:
+        tuple: Parsed legislator data in PERSON_COLUMNS order:
             - people_id: LegiScan ID for the legislator
             - person_hash: Hash of legislator data
             - party: Political party
@@ -210,25 +250,11 @@ def parse_person(person_json):
             - votesmart_id: VoteSmart ID
             - ballotpedia: Ballotpedia URL
     """
-    person_dict = json.loads(person_json)
+    person_dict = orjson.loads(person_json)
 
     person = person_dict["person"]
 
-    return {
-        "people_id": person["people_id"],
-        "person_hash": person["person_hash"],
-        "party": person["party"],
-        "role": person["role"],
-        "name": person["name"],
-        "first_name": person["first_name"],
-        "middle_name": person["middle_name"],
-        "last_name": person["last_name"],
-        "suffix": person["suffix"],
-        "nickname": person["nickname"],
-        "district": person["district"],
-        "votesmart_id": person["votesmart_id"],
-        "ballotpedia": person["ballotpedia"],
-    }
+    return tuple(person[column] for column in PERSON_COLUMNS)
 
 
 def parse_dataset(dataset):
@@ -236,7 +262,8 @@ def parse_dataset(dataset):
     Parse complete LegiScan dataset into structured dataframes.
 
     Args:
-        dataset (dict): Dictionary containing raw LegiScan dataset files
+        dataset (iterable): (file path, contents) pairs of the raw LegiScan
+            dataset files, e.g. from iter_dataset_files
 
     Returns:
         dict: Dictionary of pandas DataFrames containing parsed data:
@@ -255,56 +282,56 @@ def parse_dataset(dataset):
     """
     bills = []
     people = []
-    bill_votes = []
-    progress = []
-    referrals = []
-    calendar = []
-    amendments = []
-    supplements = []
-    texts = []
-    subjects = []
-    history = []
     votes = []
 
-    for file_path, content in dataset.items():
+    # Rows of each nested bill list, plus how many rows each bill contributed
+    bill_ids = []
+    bill_rows = {key: [] for key in BILL_TABLES}
+    bill_row_counts = {key: [] for key in BILL_TABLES}
+
+    # Parse each file as it is read so only one file's bytes are held at a time
+    for file_path, content in dataset:
         if "/bill/" in file_path:
             bill_data = parse_bill(content)
+
             # Add bill info
             bills.append(bill_data["bill_info"])
+            # legiscan_bill_id is the first of BILL_INFO_COLUMNS
+            bill_ids.append(bill_data["bill_info"][0])
 
             # Add all other bill data lists
-            progress.extend(bill_data["progress"])
-            referrals.extend(bill_data["referrals"])
-            calendar.extend(bill_data["calendar"])
-            amendments.extend(bill_data["amendments"])
-            supplements.extend(bill_data["supplements"])
-            bill_votes.extend(bill_data["votes"])
-            texts.extend(bill_data["texts"])
-            subjects.extend(bill_data["subjects"])
-            history.extend(bill_data["history"])
-
+            for key in BILL_TABLES:
+                bill_rows[key].extend(bill_data[key])
+                bill_row_counts[key].append(len(bill_data[key]))
         elif "/people/" in file_path:
-            person_data = parse_person(content)
-            people.append(person_data)
-
+            people.append(parse_person(content))
         elif "/vote/" in file_path:
-            votes_data = parse_vote(content)
-            votes.extend(votes_data)
+            votes.extend(parse_vote(content))
+
+    # Convert all lists to dataframes, stamping each nested bill table with
+    # its legiscan_bill_id in one go
+    bill_tables = {}
+    for key, table in BILL_TABLES.items():
+        table_df = pd.DataFrame(bill_rows[key])
+        if len(table_df) > 0:
+            table_df["legiscan_bill_id"] = (
+                pd.Series(bill_ids).repeat(bill_row_counts[key]).to_numpy()
+            )
+        bill_tables[table] = table_df
 
-    # Convert all lists to dataframes
     return {
-        "bills": pd.DataFrame(bills),
-        "people": pd.DataFrame(people),
-        "bill_votes": pd.DataFrame(bill_votes),
-        "votes": pd.DataFrame(votes),
-        "progress": pd.DataFrame(progress),
-        "referrals": pd.DataFrame(referrals),
-        "calendar": pd.DataFrame(calendar),
-        "amendments": pd.DataFrame(amendments),
-        "supplements": pd.DataFrame(supplements),
-        "texts": pd.DataFrame(texts),
-        "subjects": pd.DataFrame(subjects),
-        "history": pd.DataFrame(history),
+        "bills": pd.DataFrame(bills, columns=BILL_INFO_COLUMNS),
+        "people": pd.DataFrame(people, columns=PERSON_COLUMNS),
+        "bill_votes": bill_tables["bill_votes"],
+        "votes": pd.DataFrame(votes, columns=VOTE_COLUMNS),
+        "progress": bill_tables["progress"],
+        "referrals": bill_tables["referrals"],
+        "calendar": bill_tables["calendar"],
+        "amendments": bill_tables["amendments"],
+        "supplements": bill_tables["supplements"],
+        "texts": bill_tables["texts"],
+        "subjects": bill_tables["subjects"],
+        "history": bill_tables["history"],
     }
 
 
@@ -320,50 +347,52 @@ def get_most_recent_dataset_hash(project_id, dataset_id, table_id="_legiscan_pul
     Returns:
         str: Hash of most recent dataset
     """
-    most_recent_hash = query_bq(
-        f"""
+    most_recent_hash = query_bq(f"""
             select
             legiscan_hash
             from `{project_id}.{dataset_id}.{table_id}`
             order by TIMESTAMP(upload_time) desc
             limit 1
-             """
-    ).iloc[0]["legiscan_hash"]
+             """).iloc[0]["legiscan_hash"]
 
     return most_recent_hash
 
 
+@contextlib.contextmanager
 def get_dataset(state, leg_id, most_recent_hash):
     """
     Download LegiScan dataset for a given state and legislative session.
 
+    Used as a context manager; the archive stays open until the block exits so
+    its files can be read one at a time.
+
     Args:
         state (str): Two-letter state code
         leg_id (str): Legislative session ID (e.g. '89R')
         most_recent_hash (str): Hash of most recently downloaded dataset
 
-    Returns:
-        dict: Dictionary containing dataset files, or None if dataset unchanged
+    Yields:
+        zipfile.ZipFile: The open dataset archive, or None if dataset unchanged
     """
     dataset_list_url = f"https://api.legiscan.com/?key={LEGISCAN_API_KEY}&op=getDatasetList&state={state}"
 
-    # Extract number by finding first digit and taking all digits
-    leg_number = int("".join(c for c in leg_id if c.isdigit()))
+    leg_id_match = _LEG_ID_RE.match(leg_id)
+    if leg_id_match is None:
+        raise ValueError(f"Invalid legislative session ID: {leg_id}")
 
-    # Everything after the number is the session type
-    session_type = "".join(c for c in leg_id if not c.isdigit())
+    # Two-digit legislature number, then the session ('R' or a special session)
+    leg_number, session_type = leg_id_match.groups()
     session_tag = "Regular Session" if session_type == "R" else "Special Session"
 
-    response = requests.get(dataset_list_url)
+    response = SESSION.get(dataset_list_url, timeout=60)
     result = response.json()
-    datasets = result["datasetlist"]
-    curr_dataset = list(
-        filter(
-            lambda a: a["session_tag"] == session_tag
-            and a["session_name"][:2] == str(leg_number),
-            datasets,
-        )
-    )
+
+    # Index the datasets by session tag and legislature number
+    datasets = {}
+    for dataset in result["datasetlist"]:
+        key = (dataset["session_tag"], dataset["session_name"][:2])
+        datasets.setdefault(key, []).append(dataset)
+    curr_dataset = datasets.get((session_tag, leg_number), [])
 
     if len(curr_dataset) > 1:
         raise Exception(f"Found multiple datasets matching {leg_id}")
@@ -378,26 +407,42 @@ def get_dataset(state, leg_id, most_recent_hash):
 
     if curr_dataset_hash == most_recent_hash:
         print("Current hash matches most recent data pull. Not downloading data.")
-        return None
+        yield None
+        return
 
     print("Downloading new Legiscan weekly dataset")
-    weekly_dataset_url = f"https://api.legiscan.com/?key={LEGISCAN_API_KEY}&op=getDataset&id={session_id}&access_key={access_key}"
-    weekly_dataset_response = requests.get(weekly_dataset_url, timeout=30)
-    weekly_dataset = weekly_dataset_response.json()
-
-    # Check if response is valid
-    if weekly_dataset["status"] != "OK":
-        raise Exception(f"API returned error status: {weekly_dataset['status']}")
+    # getDatasetRaw returns the zip archive itself instead of base64 inside a
+    # JSON document, so it can be streamed to a temporary file as it arrives
+    weekly_dataset_url = f"https://api.legiscan.com/?key={LEGISCAN_API_KEY}&op=getDatasetRaw&id={session_id}&access_key={access_key}"
+    with tempfile.SpooledTemporaryFile(max_size=DATASET_SPOOL_BYTES) as zip_file:
+        with SESSION.get(weekly_dataset_url, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                zip_file.write(chunk)
+
+        # Check if response is valid; errors come back as JSON, not a zip
+        zip_file.seek(0)
+        if not zipfile.is_zipfile(zip_file):
+            zip_file.seek(0)
+            error = orjson.loads(zip_file.read())
+            raise Exception(f"API returned error status: {error.get('status')}")
+
+        with zipfile.ZipFile(zip_file, "r") as zip_ref:
+            yield zip_ref
+
+
+def iter_dataset_files(zip_ref):
+    """
+    Read the files of a LegiScan dataset archive one at a time.
 
-    # Get the zip data and decode from base64
-    zip_data = base64.b64decode(weekly_dataset["dataset"]["zip"])
+    Args:
+        zip_ref (zipfile.ZipFile): Open dataset archive
 
-    # Create a ZipFile object from the bytes
-    zip_buffer = io.BytesIO(zip_data)
-    with zipfile.ZipFile(zip_buffer, "r") as zip_ref:
-        # Extract all files to memory
-        dataset = {name: zip_ref.read(name) for name in zip_ref.namelist()}
-    return dataset
+    Yields:
+        tuple: (file path, file contents as bytes)
+    """
+    for name in zip_ref.namelist():
+        yield name, zip_ref.read(name)
 
 
 def legiscan_to_bigquery(leg_session, project_id, dataset_id, env="dev"):
@@ -412,25 +457,40 @@ def legiscan_to_bigquery(leg_session, project_id, dataset_id, env="dev"):
     """
 
     most_recent_dataset_hash = get_most_recent_dataset_hash(project_id, dataset_id)
-    raw_dataset = get_dataset(
+    with get_dataset(
         "TX", leg_session, most_recent_hash=most_recent_dataset_hash
-    )
-    if raw_dataset == None:  # if there's nothing new, do nothing
-        return
+    ) as zip_ref:
+        if zip_ref is None:  # if there's nothing new, do nothing
+            return
+
+        members = zip_ref.infolist()
+        total_size_bytes = sum(member.file_size for member in members)
+        total_size_gb = total_size_bytes / (1024 * 1024 * 1024)
+        print(f"Raw dataset size: {len(members)} files ({total_size_gb:.2f} GB)")
+
+        hash_file = next(
+            (
+                member.filename
+                for member in members
+                if member.filename.endswith("/hash.md5")
+            ),
+            None,
+        )
+        if hash_file is None:
+            raise ValueError("LegiScan dataset archive has no hash.md5 file")
+        legiscan_hash = zip_ref.read(hash_file).decode("utf-8")
 
-    total_size_bytes = sum(len(data) for data in raw_dataset.values())
-    total_size_gb = total_size_bytes / (1024 * 1024 * 1024)
-    print(f"Raw dataset size: {len(raw_dataset)} files ({total_size_gb:.2f} GB)")
+        # The listing's hash can lag the archive; skip the parse and upload if
+        # the archive itself is the one we already loaded
+        if legiscan_hash == most_recent_dataset_hash:
+            print("Dataset hash matches most recent data pull. Not loading data.")
+            return
 
-    clean_dataset = parse_dataset(raw_dataset)
-    clean_size_bytes = sum(
-        df.memory_usage(deep=True).sum() for df in clean_dataset.values()
-    )
-    clean_size_gb = clean_size_bytes / (1024 * 1024 * 1024)
-    print(f"Clean dataset size: {len(clean_dataset)} tables ({clean_size_gb:.2f} GB)")
+        clean_dataset = parse_dataset(iter_dataset_files(zip_ref))
 
-    legiscan_hash = raw_dataset["TX/2025-2026_89th_Legislature/hash.md5"]
-    legiscan_hash = legiscan_hash.decode("utf-8")
+    # Row counts are free, unlike a deep memory_usage walk over every string
+    clean_rows = sum(len(df) for df in clean_dataset.values())
+    print(f"Clean dataset size: {len(clean_dataset)} tables ({clean_rows} rows)")
 
     legiscan_pull_info = {
         "upload_time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -441,12 +501,19 @@ def legiscan_to_bigquery(leg_session, project_id, dataset_id, env="dev"):
         legiscan_pull_df, project_id, dataset_id, "_legiscan_pulls", env, "append"
     )
 
-    for table in clean_dataset.keys():
-        table_df = clean_dataset[table]
+    # Call the task directly, one table at a time, so the uploads keep the
+    # task's retries and timeout whether or not a flow is running
+    for table, table_df in clean_dataset.items():
         dataframe_to_bigquery(
-            table_df, PROJECT_ID, dataset_id, f"legiscan_{table}", env, "drop"
+            table_df,
+            PROJECT_ID,
+            dataset_id,
+            f"legiscan_{table}",
+            env,
+            "drop",
+            as_parquet=True,
         )
-        print(table_df)
+        print(f"Loaded legiscan_{table}")
 
 
 ################################################################################
@@ -455,7 +522,7 @@ def legiscan_to_bigquery(leg_session, project_id, dataset_id, env="dev"):
 
 if __name__ == "__main__":
     with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YAML_LOADER)
 
     leg_session = config["info"]["LegSess"]
 
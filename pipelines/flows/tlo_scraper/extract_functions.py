@@ -1,31 +1,124 @@
+import ast
+import contextlib
 import datetime
 import json
 import logging
 import re
+import string
+from concurrent.futures import ThreadPoolExecutor
 
-import duckdb
 import feedparser
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from prefect import task
 from prefect.cache_policies import NO_CACHE
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from pipelines.utils.utils import (
     FtpConnection,
-    get_current_table_data,
     get_secret,
     query_bq,
 )
 
 logger = logging.getLogger(__name__)
 PROJECT_ID = get_secret(secret_id="GCP_PROJECT_ID")
+MAX_WORKERS = 8  # concurrent requests when scraping TLO pages and feeds
+MAX_FTP_WORKERS = 4  # concurrent connections to the TLO FTP server
+
+# Shared session so repeated requests to the same hosts reuse connections.
+# The pool is sized to cover MAX_WORKERS threads across a few hosts.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
+
+# Pages and feeds already fetched in this process, keyed on URL. Flow runs get
+# their own process, so these only dedupe requests within a single run.
+_PAGE_CACHE = {}
+_FEED_CACHE = {}
+
+# Meeting date and time in the upcoming meetings RSS titles and descriptions
+_DATE_RE = re.compile(r"-\s*(\d{1,2}/\d{1,2}/\d{4})")
+_TIME_RE = re.compile(r"Time:\s*(\d{1,2}:\d{2}\s*[AP]M)")
+
+# Patterns used per paragraph, bill and subject while parsing
+_WS_RE = re.compile(r"\s+")
+_CRLF_RE = re.compile(r"[\r\n]")
+_LEG_SESS_RE = re.compile(r"LegSess=(\d+)")
+# e.g. 'City Government--Employees/Officers (I0061)' -> title, subject ID
+_SUBJECT_RE = re.compile(r"^(.*?)\s*\(([^)]+)\)\s*$")
+
+# Committee info fields at the top of a meeting notice, matched in one pass
+_MEETING_FIELD_RE = re.compile(r"^(COMMITTEE|TIME & DATE|PLACE):\s*(.*)$")
+_MEETING_FIELD_KEYS = {
+    "COMMITTEE": "committee",
+    "TIME & DATE": "time_date",
+    "PLACE": "place",
+}
+_CHAIR_RE = re.compile(r"\s*CHAIR:\s*")
+
+# Compiled paths to the bill text, analysis and fiscal note versions in the
+# bill history XML, and the version type each document group maps to
+_DOC_TYPES_XP = etree.XPath(
+    "//billtext/docTypes/*[self::bill or self::analysis or self::fiscalNote]"
+)
+_VERSIONS_XP = etree.XPath("versions/version")
+_DOC_TYPE_NAMES = {"bill": "Bill", "analysis": "Analysis", "fiscalNote": "Fiscal Note"}
 
 ################################################################################
 # HELPER FUNCTIONS
 ################################################################################
 
 
+def fetch_page(url, timeout=20):
+    """
+    Fetch a page's text through SESSION, reusing earlier successful responses.
+
+    Committee meeting pages are scraped more than once per run (once for the
+    meetings table and again for the meeting bills table), so only the first
+    request for a URL goes over the network.
+
+    Args:
+        url (str): URL of the page
+        timeout (int): Request timeout in seconds
+
+    Returns:
+        str: Page text
+    """
+    if url not in _PAGE_CACHE:
+        response = SESSION.get(url, timeout=timeout)
+        if not response.ok:
+            return response.text
+        _PAGE_CACHE[url] = response.text
+    return _PAGE_CACHE[url]
+
+
+def fetch_feed(url):
+    """
+    Parse an RSS feed with feedparser, reusing earlier successful results.
+
+    Args:
+        url (str): URL of the RSS feed
+
+    Returns:
+        feedparser.FeedParserDict: Parsed feed
+    """
+    if url not in _FEED_CACHE:
+        feed = feedparser.parse(url)
+        if feed.get("status") != 200:
+            return feed
+        _FEED_CACHE[url] = feed
+    return _FEED_CACHE[url]
+
+
 def clean_bill_id(bill_id):
     """
     Transform bill ID from format like '89(R) HB 1' into standardized format.
@@ -38,7 +131,6 @@ def clean_bill_id(bill_id):
             bill_number (str): Bill number in format like 'HB1'
             session (str): Session in format like '89R'
     """
-    print(bill_id)
     # Split into session and bill parts
     session_part, bill_part = bill_id.split(") ")
 
@@ -47,103 +139,58 @@ def clean_bill_id(bill_id):
 
     # Clean bill number (e.g. 'HB 1' -> 'HB1')
     bill_number = bill_part.replace(" ", "")
-    print(f"\tBill Number: {bill_number}")
-    print(f"\tSession: {session}")
+    logger.debug(f"{bill_id} -> Bill Number: {bill_number}, Session: {session}")
     return bill_number, session
 
 
-def merge_with_current_data(new_df, curr_df):
+def clean_bill_ids(bill_ids):
     """
-    Merge two dataframes and handle first_seen_at and last_seen_at timestamps.
+    Vectorized version of clean_bill_id for a whole column of bill IDs.
 
     Args:
-        new_df: DataFrame containing new records
-        curr_df: DataFrame containing existing records
-        match_columns: List of column names to match on
+        bill_ids (pd.Series): Bill IDs in format like '89(R) HB 1'
 
     Returns:
-        DataFrame with first_seen_at and last_seen_at columns properly set
+        tuple: (bill_numbers, sessions)
+            bill_numbers (pd.Series): Bill numbers in format like 'HB1'
+            sessions (pd.Series): Sessions in format like '89R'
+        IDs that don't match the expected format get an empty bill number.
     """
+    parts = bill_ids.str.partition(") ")
+    sessions = parts[0].str.replace("(", "", regex=False)
+    bill_numbers = parts[2].str.replace(" ", "", regex=False)
+    return bill_numbers, sessions
 
-    if len(new_df) == 0:
-        return curr_df
-
-    # Get current timestamp truncated to minute
-    curr_time = pd.Timestamp.now().floor("min")
-
-    if curr_df is None or len(curr_df) == 0:
-        # Add timestamp columns to new_df
-        new_df["first_seen_at"] = curr_time
-        new_df["last_seen_at"] = curr_time
-        return new_df
-
-    match_columns = new_df.columns.tolist()
-
-    # Add timestamp columns to new_df
-    new_df["first_seen_at"] = curr_time
-    new_df["last_seen_at"] = curr_time
 
-    # Get the full set of columns
-    all_columns = set(new_df.columns) | set(curr_df.columns)
-
-    # Add missing columns with NaN
-    for df in [new_df, curr_df]:
-        for col in all_columns:
-            if col not in df.columns:
-                df[col] = pd.NA
-
-    # Replace null values with a distinct placeholder before merging
-    # This prevents merge issues with null values
-    placeholder = "___NULL___"
-    new_df = new_df.fillna(placeholder)
-    curr_df = curr_df.fillna(placeholder)
-
-    # Find matching and non-matching rows
-    merged = new_df.merge(curr_df, on=match_columns, how="outer", indicator=True)
-
-    # For new data only, keep current timestamps
-    new_only_mask = merged["_merge"] == "left_only"
-    merged.loc[new_only_mask, "first_seen_at"] = curr_time
-    merged.loc[new_only_mask, "last_seen_at"] = curr_time
+def attach_bill_ids(raw_bills_df):
+    """
+    Add cleaned bill and session IDs to the raw bills data once, so every
+    get_*_data helper can reuse them instead of cleaning the IDs again.
 
-    # For matching rows, keep original first_seen_at and update last_seen_at
-    matching_mask = merged["_merge"] == "both"
-    merged.loc[matching_mask, "first_seen_at"] = merged.loc[
-        matching_mask, "first_seen_at_y"
-    ]
-    merged.loc[matching_mask, "last_seen_at"] = curr_time
+    Args:
+        raw_bills_df (pd.DataFrame): DataFrame containing raw bill data
 
-    # For rows only in curr_df, keep original timestamps
-    curr_only_mask = merged["_merge"] == "right_only"
-    merged.loc[curr_only_mask, "first_seen_at"] = merged.loc[
-        curr_only_mask, "first_seen_at_y"
-    ]
-    merged.loc[curr_only_mask, "last_seen_at"] = merged.loc[
-        curr_only_mask, "last_seen_at_y"
-    ]
+    Returns:
+        pd.DataFrame: raw_bills_df with _bill_id and _leg_id columns added
+    """
+    bill_numbers, sessions = clean_bill_ids(raw_bills_df["bill_id"])
+    return raw_bills_df.assign(_bill_id=bill_numbers, _leg_id=sessions)
 
-    # Clean up merge artifacts
-    merged = merged.drop(
-        [
-            "first_seen_at_x",
-            "first_seen_at_y",
-            "last_seen_at_x",
-            "last_seen_at_y",
-            "_merge",
-        ],
-        axis=1,
-    )
 
-    # Drop any remaining columns ending with _x or _y
-    x_y_cols = [
-        col for col in merged.columns if col.endswith("_x") or col.endswith("_y")
-    ]
-    merged = merged.drop(columns=x_y_cols)
+def get_clean_bill_ids(raw_bills_df):
+    """
+    Get the cleaned bill and session IDs for the raw bills data, using the ones
+    from attach_bill_ids when they are there.
 
-    # Replace the placeholder back with null values
-    merged = merged.replace(placeholder, pd.NA)
+    Args:
+        raw_bills_df (pd.DataFrame): DataFrame containing raw bill data
 
-    return merged
+    Returns:
+        tuple: (bill_numbers, sessions) as returned by clean_bill_ids
+    """
+    if "_bill_id" in raw_bills_df.columns and "_leg_id" in raw_bills_df.columns:
+        return raw_bills_df["_bill_id"], raw_bills_df["_leg_id"]
+    return clean_bill_ids(raw_bills_df["bill_id"])
 
 
 def merge_new_data_in_database(
@@ -195,9 +242,18 @@ def get_rss_data():
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
     entries = []
 
-    for timeframe, feeds in rss_feeds.items():
-        for rss_label, rss_url in feeds.items():
-            feed = feedparser.parse(rss_url)
+    feed_list = [
+        (timeframe, rss_label, rss_url)
+        for timeframe, feeds in rss_feeds.items()
+        for rss_label, rss_url in feeds.items()
+    ]
+    # Feeds are fetched concurrently; map keeps results in feed_list order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        parsed_feeds = executor.map(
+            fetch_feed, [rss_url for _, _, rss_url in feed_list]
+        )
+
+        for (timeframe, rss_label, _), feed in zip(feed_list, parsed_feeds):
             for entry in feed.entries:
                 entry_dict = {
                     "timeframe": timeframe,
@@ -229,21 +285,24 @@ def get_upcoming_from_rss():
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
     entries = []
 
-    for rss_label, rss_url in zip(upcoming_rss_urls.keys(), upcoming_rss_urls.values()):
-        feed = feedparser.parse(rss_url)
-        for entry in feed.entries:
-            entry_dict = {
-                "rss_label": rss_label,
-                "date": current_date,
-                "description": entry.get("description", None),
-            }
-            for key, value in entry.items():
-                if type(value) == feedparser.util.FeedParserDict:
-                    for k, v in value.items():
-                        entry_dict[f"{key}_{k}"] = v
-                else:
-                    entry_dict[key] = value
-            entries.append(entry_dict)
+    # Feeds are fetched concurrently; map keeps results in feed order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        parsed_feeds = executor.map(fetch_feed, upcoming_rss_urls.values())
+
+        for rss_label, feed in zip(upcoming_rss_urls.keys(), parsed_feeds):
+            for entry in feed.entries:
+                entry_dict = {
+                    "rss_label": rss_label,
+                    "date": current_date,
+                    "description": entry.get("description", None),
+                }
+                for key, value in entry.items():
+                    if isinstance(value, feedparser.util.FeedParserDict):
+                        for k, v in value.items():
+                            entry_dict[f"{key}_{k}"] = v
+                    else:
+                        entry_dict[key] = value
+                entries.append(entry_dict)
 
     return pd.DataFrame(entries)
 
@@ -288,8 +347,9 @@ def get_rss_committee_meetings():
     meetings_links = filtered_meetings["link"].tolist()
     meetings_labels = filtered_meetings["rss_label"].tolist()
 
-    # Get detailed meeting data
-    meetings_df = pd.DataFrame(map(read_committee_meeting, meetings_links))
+    # Get detailed meeting data, fetching meeting notices concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        meetings_df = pd.DataFrame(executor.map(read_committee_meeting, meetings_links))
     meetings_df = meetings_df[meetings_df["bills"].notna()]
 
     # If no valid meetings with bills found, return empty DataFrame
@@ -308,24 +368,19 @@ def get_rss_committee_meetings():
         )
 
     # Convert bills columns from string to list if needed
-    if isinstance(meetings_df["bills"].iloc[0], str):
-        meetings_df["bills"] = meetings_df["bills"].apply(eval)
-    if isinstance(meetings_df["deleted_bills"].iloc[0], str):
-        meetings_df["deleted_bills"] = meetings_df["deleted_bills"].apply(eval)
-    if isinstance(meetings_df["added_bills"].iloc[0], str):
-        meetings_df["added_bills"] = meetings_df["added_bills"].apply(eval)
+    for col in ["bills", "deleted_bills", "added_bills"]:
+        meetings_df[col] = [
+            ast.literal_eval(value) if isinstance(value, str) else value
+            for value in meetings_df[col].tolist()
+        ]
 
     # Extract date and time from filtered_meetings
-    meetings_df["date"] = filtered_meetings["title"].str.extract(
-        r"-\s*(\d{1,2}/\d{1,2}/\d{4})"
-    )
-    meetings_df["time"] = filtered_meetings["description"].str.extract(
-        r"Time:\s*(\d{1,2}:\d{2}\s*[AP]M)"
-    )
+    meetings_df["date"] = filtered_meetings["title"].str.extract(_DATE_RE)
+    meetings_df["time"] = filtered_meetings["description"].str.extract(_TIME_RE)
 
     # Create standardized output
     result = []
-    for i, meeting in meetings_df.iterrows():
+    for i, meeting in zip(meetings_df.index, meetings_df.to_dict("records")):
         meeting_info = {
             "committee": meeting["committee"],
             "chamber": "Senate" if meetings_labels[i] == "meetings_senate" else "House",
@@ -387,8 +442,11 @@ def get_committee_meetings(committee_meetings_url):
     Returns:
         dict: Dictionary containing meeting details
     """
-    response = requests.get(committee_meetings_url, timeout=20)
-    soup = BeautifulSoup(response.text, "html.parser")
+    page_html = fetch_page(committee_meetings_url)
+    # Only the meetings table is used, so skip building the rest of the page
+    soup = BeautifulSoup(
+        page_html, "lxml", parse_only=SoupStrainer("table", id="tblMeetings")
+    )
 
     # Find the meetings table
     meetings_table = soup.find("table", id="tblMeetings")
@@ -399,59 +457,31 @@ def get_committee_meetings(committee_meetings_url):
     meeting_rows = meetings_table.find_all("tr")
     meetings = []
 
+    base_url = "https://capitol.texas.gov"
+    html_link = 'a[href*="html"]'
+    pdf_link = 'a[href*="pdf" i]'
+
+    def link_url(cell, selector):
+        link = cell.select_one(selector)
+        return f"{base_url}{link['href']}" if link else None
+
     for row in meeting_rows:
         cells = row.find_all("td")
         if (
             len(cells) >= 7
-            and type(cells[1].text) == str
+            and isinstance(cells[1].text, str)
             and cells[1].text.lower() != "time"
         ):
             meeting = {
                 "date": cells[0].get_text(strip=True),
                 "time": cells[1].get_text(strip=True),
                 "subcommittee": cells[2].get_text(strip=True),
-                "hearing_notice_html": (
-                    "https://capitol.texas.gov"
-                    + cells[3].find("a", href=lambda x: x and "html" in x)["href"]
-                    if cells[3].find("a", href=lambda x: x and "html" in x)
-                    else None
-                ),
-                "hearing_notice_pdf": (
-                    "https://capitol.texas.gov"
-                    + cells[3].find("a", href=lambda x: x and "pdf" in x.lower())[
-                        "href"
-                    ]
-                    if cells[3].find("a", href=lambda x: x and "pdf" in x.lower())
-                    else None
-                ),
-                "minutes_html": (
-                    "https://capitol.texas.gov"
-                    + cells[4].find("a", href=lambda x: x and "html" in x)["href"]
-                    if cells[4].find("a", href=lambda x: x and "html" in x)
-                    else None
-                ),
-                "minutes_pdf": (
-                    "https://capitol.texas.gov"
-                    + cells[4].find("a", href=lambda x: x and "pdf" in x.lower())[
-                        "href"
-                    ]
-                    if cells[4].find("a", href=lambda x: x and "pdf" in x.lower())
-                    else None
-                ),
-                "witness_list_html": (
-                    "https://capitol.texas.gov"
-                    + cells[5].find("a", href=lambda x: x and "html" in x)["href"]
-                    if cells[5].find("a", href=lambda x: x and "html" in x)
-                    else None
-                ),
-                "witness_list_pdf": (
-                    "https://capitol.texas.gov"
-                    + cells[5].find("a", href=lambda x: x and "pdf" in x.lower())[
-                        "href"
-                    ]
-                    if cells[5].find("a", href=lambda x: x and "pdf" in x.lower())
-                    else None
-                ),
+                "hearing_notice_html": link_url(cells[3], html_link),
+                "hearing_notice_pdf": link_url(cells[3], pdf_link),
+                "minutes_html": link_url(cells[4], html_link),
+                "minutes_pdf": link_url(cells[4], pdf_link),
+                "witness_list_html": link_url(cells[5], html_link),
+                "witness_list_pdf": link_url(cells[5], pdf_link),
                 "comments": cells[6].get_text(strip=True),
             }
 
@@ -495,10 +525,15 @@ def get_html_committee_meetings(leg_session):
             ]
         )
 
-    # Get meetings for each committee
+    # Get meetings for each committee, fetching committee pages concurrently
     meetings = []
-    for _, committee in committee_links.iterrows():
-        committee_meetings = get_committee_meetings(committee["link"])
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        all_committee_meetings = list(
+            executor.map(get_committee_meetings, committee_links["link"])
+        )
+    for committee, committee_meetings in zip(
+        committee_links.to_dict("records"), all_committee_meetings
+    ):
         # Add chamber info to each meeting
         for meeting in committee_meetings:
             meeting["chamber"] = (
@@ -512,45 +547,54 @@ def get_html_committee_meetings(leg_session):
     committee_meetings_df = pd.DataFrame(meetings)
 
     # Get detailed bill info for each meeting
-    committee_bills = []
-    for committee in committee_meetings_df["hearing_notice_html"]:
-        committee_bills.append(read_committee_meeting(committee))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        committee_bills = list(
+            executor.map(
+                read_committee_meeting, committee_meetings_df["hearing_notice_html"]
+            )
+        )
 
     committee_bills_df = pd.DataFrame(committee_bills)
     committee_bills_df = committee_bills_df[committee_bills_df["bills"].notna()]
 
-    # Create standardized output
+    # Create standardized output, reading rows as plain dicts. committee_bills_df
+    # keeps the index of the meeting it was read from.
+    meeting_records = committee_meetings_df.to_dict("records")
     result = []
-    for i, meeting in committee_bills_df.iterrows():
+    for i, meeting in zip(
+        committee_bills_df.index, committee_bills_df.to_dict("records")
+    ):
+        meeting_meta = meeting_records[i]
+
         # Extract time from original meetings dataframe
         meeting_time = (
-            committee_meetings_df.iloc[i]["time"].split(" ")[0]
+            meeting_meta["time"].split(" ")[0]
             + " "
-            + committee_meetings_df.iloc[i]["time"].split(" ")[1]
+            + meeting_meta["time"].split(" ")[1]
         )
 
         meeting_info = {
             "committee": meeting["committee"],
-            "chamber": committee_meetings_df.iloc[i]["chamber"],
-            "committee_meetings_link": committee_meetings_df.iloc[i]["committee_link"],
-            "leg_id": committee_meetings_df.iloc[i]["leg_id"],
-            "date": committee_meetings_df.iloc[i]["date"],
+            "chamber": meeting_meta["chamber"],
+            "committee_meetings_link": meeting_meta["committee_link"],
+            "leg_id": meeting_meta["leg_id"],
+            "date": meeting_meta["date"],
             "time": meeting_time,
             "location": meeting["place"],
             "chair": meeting["chair"],
             "meeting_url": meeting["meeting_url"],
             "bills": [],
-            "subcommittee": committee_meetings_df.iloc[i]["subcommittee"],
-            "hearing_notice_html": committee_meetings_df.iloc[i]["hearing_notice_html"],
-            "hearing_notice_pdf": committee_meetings_df.iloc[i]["hearing_notice_pdf"],
-            "minutes_html": committee_meetings_df.iloc[i]["minutes_html"],
-            "minutes_pdf": committee_meetings_df.iloc[i]["minutes_pdf"],
-            "witness_list_html": committee_meetings_df.iloc[i]["witness_list_html"],
-            "witness_list_pdf": committee_meetings_df.iloc[i]["witness_list_pdf"],
-            "comments": committee_meetings_df.iloc[i]["comments"],
+            "subcommittee": meeting_meta["subcommittee"],
+            "hearing_notice_html": meeting_meta["hearing_notice_html"],
+            "hearing_notice_pdf": meeting_meta["hearing_notice_pdf"],
+            "minutes_html": meeting_meta["minutes_html"],
+            "minutes_pdf": meeting_meta["minutes_pdf"],
+            "witness_list_html": meeting_meta["witness_list_html"],
+            "witness_list_pdf": meeting_meta["witness_list_pdf"],
+            "comments": meeting_meta["comments"],
         }
 
-        if type(meeting["bills"]) != list or len(meeting["bills"]) < 1:
+        if not isinstance(meeting["bills"], list) or len(meeting["bills"]) < 1:
             result.append(meeting_info)
 
         # Add regular bills
@@ -588,23 +632,49 @@ def get_html_committee_meetings(leg_session):
     return pd.DataFrame(result)
 
 
-def extract_committee_meetings_links(committees_page_url, leg_id):
-    session = requests.Session()
+def get_committee_form_fields(session, committees_page_url):
+    """
+    Gets the hidden ASP.NET form fields from a committees page.
+
+    Args:
+        session (requests.Session): Session used for the committees pages
+        committees_page_url (str): URL of the committees page
 
-    # Step 1: GET request to retrieve hidden form fields
+    Returns:
+        dict: __VIEWSTATE, __EVENTVALIDATION and __VIEWSTATEGENERATOR values
+    """
     response = session.get(committees_page_url)
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Only the form inputs are needed from this page
+    soup = BeautifulSoup(response.text, "lxml", parse_only=SoupStrainer("input"))
+
+    return {
+        name: soup.find("input", {"name": name})["value"]
+        for name in ["__VIEWSTATE", "__EVENTVALIDATION", "__VIEWSTATEGENERATOR"]
+    }
+
+
+def extract_committee_meetings_links(committees_page_url, leg_id, session=None):
+    """
+    Gets the committee links on a committees page for a legislature.
+
+    Args:
+        committees_page_url (str): URL of the committees page for a chamber
+        leg_id (str): Legislature number to select, like '89'
+        session (requests.Session): Session to reuse. A new one is made if not given.
+
+    Returns:
+        list: Dictionaries with the name and href of each committee
+    """
+    if session is None:
+        session = requests.Session()
 
-    # Extract necessary hidden fields
-    viewstate = soup.find("input", {"name": "__VIEWSTATE"})["value"]
-    eventvalidation = soup.find("input", {"name": "__EVENTVALIDATION"})["value"]
-    viewstategenerator = soup.find("input", {"name": "__VIEWSTATEGENERATOR"})["value"]
+    # Step 1: GET request to retrieve hidden form fields. ASP.NET ties them to
+    # the page that issued them, so every chamber's page needs its own GET.
+    form_fields = get_committee_form_fields(session, committees_page_url)
 
     # Step 2: POST request with hidden fields and selected legislature
     data = {
-        "__VIEWSTATE": viewstate,
-        "__EVENTVALIDATION": eventvalidation,
-        "__VIEWSTATEGENERATOR": viewstategenerator,
+        **form_fields,
         "__EVENTTARGET": "ddlLegislature",  # Mimic dropdown change
         "__EVENTARGUMENT": "",
         "ddlLegislature": leg_id,
@@ -612,7 +682,7 @@ def extract_committee_meetings_links(committees_page_url, leg_id):
 
     response = session.post(committees_page_url, data=data)
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(response.text, "lxml")
 
     committees_list = soup.find_all("a", id="CmteList")
 
@@ -634,12 +704,17 @@ def get_committee_meetings_links(leg_session, max_errors=5):
     if leg_id == leg_session:
         leg_id = leg_id[:-1]
 
+    # One session for all three chambers, so the connection is reused
+    session = requests.Session()
+
     committee_meetings = []
     error_count = 0
     for chamber in ["H", "J", "S"]:
         try:
             committees_page_url = f"{committees_list_url}?Chamber={chamber}"
-            committees = extract_committee_meetings_links(committees_page_url, leg_id)
+            committees = extract_committee_meetings_links(
+                committees_page_url, leg_id, session=session
+            )
 
             for committee in committees:
                 print(committees_url + committee["href"])
@@ -671,7 +746,7 @@ def get_house_hearing_videos_data(house_videos_url, leg_id):
     headers = (
         {}
     )  #'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:123.0) Gecko/20100101 Firefox/123.0'}
-    response = requests.get(house_videos_url, headers=headers, timeout=20)
+    response = SESSION.get(house_videos_url, headers=headers, timeout=20)
 
     videos_list = json.loads(response.text)
     videos_df = pd.DataFrame(videos_list)
@@ -681,8 +756,8 @@ def get_house_hearing_videos_data(house_videos_url, leg_id):
 def get_senate_hearing_videos_data(senate_videos_url, leg_id):
     leg_num = leg_id[:-1]  # Get all but last character
     senate_videos_url = senate_videos_url.replace("{leg_id}", f"{leg_num}")
-    response = requests.get(senate_videos_url, timeout=20)
-    soup = BeautifulSoup(response.text, "html.parser")
+    response = SESSION.get(senate_videos_url, timeout=20)
+    soup = BeautifulSoup(response.text, "lxml")
     videos_table = soup.find("table")
     videos_rows = videos_table.find_all("tr")
     videos_list = []
@@ -737,7 +812,7 @@ def get_committee_hearing_videos_data(leg_id):
     senate_videos_df["leg_id"] = leg_id
     # date, program, video_link
 
-    return pd.concat([house_videos_df, senate_videos_df])
+    return pd.concat([house_videos_df, senate_videos_df], ignore_index=True)
 
 
 def get_indv_bill_stages(bill_stages_url, bill_id, leg_id):
@@ -745,8 +820,8 @@ def get_indv_bill_stages(bill_stages_url, bill_id, leg_id):
     TO DO: WRITE DESCRIPTION
     """
     bill_text_url = f"{bill_stages_url}?LegSess={leg_id}&Bill={bill_id}"
-    site_html = requests.get(bill_text_url, timeout=30).text
-    soup = BeautifulSoup(site_html, "html.parser")
+    site_html = SESSION.get(bill_text_url, timeout=30).text
+    soup = BeautifulSoup(site_html, "lxml")
 
     stages_div = soup.find("div", id="usrBillStages_pnlBillStages")
     stages_div = soup.find("div", class_="bill-status")
@@ -767,20 +842,21 @@ def get_indv_bill_stages(bill_stages_url, bill_id, leg_id):
             img = box.find("img")
             img_src = img["src"].split("/")[-1] if img else None
 
-            if len(text.split("\n")) > 2:
+            lines = text.split("\n")
+            if len(lines) > 2:
                 stage.update(
                     {
-                        "stage": text.split("\n")[0],
-                        "stage_title": text.split("\n")[1],
-                        "stage_date": "".join(text.split("\n")[2:]),
+                        "stage": lines[0],
+                        "stage_title": lines[1],
+                        "stage_date": "".join(lines[2:]),
                         "div_class": div_class.split("-")[-1],
                     }
                 )
-            elif len(text.split("\n")) == 2:
+            elif len(lines) == 2:
                 stage.update(
                     {
-                        "stage": text.split("\n")[0],
-                        "stage_title": text.split("\n")[1],
+                        "stage": lines[0],
+                        "stage_title": lines[1],
                         "div_class": div_class.split("-")[-1],
                         "stage_date": None,
                     }
@@ -819,15 +895,31 @@ def get_bill_stages(raw_bills_df, max_errors=5, log_every=20):
     bill_stages_url = "https://capitol.texas.gov/BillLookup/BillStages.aspx"
     bill_stages = []
     error_count = 0
-    for i, row in raw_bills_df.iterrows():
-        bill_id, leg_id = clean_bill_id(row["bill_id"])
-        try:
+
+    # Bill stage pages are fetched concurrently; results are collected in order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = []
+        bill_numbers, sessions = get_clean_bill_ids(raw_bills_df)
+        for i, (bill_id, leg_id) in enumerate(
+            zip(bill_numbers.tolist(), sessions.tolist())
+        ):
             if i % log_every == 0:
                 print(f"Getting bill stages for {bill_id} in the {leg_id} leg session.")
-            bill_stages.extend(get_indv_bill_stages(bill_stages_url, bill_id, leg_id))
-        except Exception as e:
-            print(f"Error getting bill stages for {bill_id}: {e}")
-            error_count += 1
+            futures.append(
+                (
+                    bill_id,
+                    executor.submit(
+                        get_indv_bill_stages, bill_stages_url, bill_id, leg_id
+                    ),
+                )
+            )
+
+        for bill_id, future in futures:
+            try:
+                bill_stages.extend(future.result())
+            except Exception as e:
+                print(f"Error getting bill stages for {bill_id}: {e}")
+                error_count += 1
     if error_count > max_errors:
         logger.error(
             f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -- Failed to get bill stages for {error_count} bills"
@@ -857,11 +949,7 @@ def get_bill_urls(base_path, leg_session, ftp_connection, max_errors=5):
     # Build base URL from config
     base_url = base_path.format(LegSess=leg_session)
 
-    bill_urls = []
-
-    # Process both house and senate bills
-    error_count = 0
-    for chamber in [
+    chambers = [
         "house_bills",
         "senate_bills",
         "house_joint_resolutions",
@@ -870,38 +958,62 @@ def get_bill_urls(base_path, leg_session, ftp_connection, max_errors=5):
         "senate_concurrent_resolutions",
         "house_resolutions",
         "senate_resolutions",
-    ]:
-        # Build URL for this chamber
-        chamber_url = f"{base_url}/billhistory/{chamber}"
-
-        # Get list of bill range folders (HB00001_HB00099 etc)
-        try:
-            range_folders = ftp_connection.ls(chamber_url)
-        except Exception as e:
-            logger.debug(f"Error getting folders for {chamber_url}: {e}")
+    ]
+    chamber_urls = [f"{base_url}/billhistory/{chamber}" for chamber in chambers]
+
+    def list_folder(connection, folder_url):
+        return connection.ls(folder_url)
+
+    # Get list of bill range folders (HB00001_HB00099 etc) for every chamber
+    range_folders = []
+    for chamber_url, (folders, error) in zip(
+        chamber_urls,
+        ftp_connection.imap(list_folder, chamber_urls, max_workers=MAX_FTP_WORKERS),
+    ):
+        if error:
+            logger.debug(f"Error getting folders for {chamber_url}: {error}")
             continue
+        range_folders.extend(folders)
 
-        # Get bill XML files from each range folder
-        for folder_url in range_folders:
-            try:
-                bill_xmls = ftp_connection.ls(folder_url)
-                bill_urls.extend(bill_xmls)
-            except Exception as e:
-                logger.debug(f"Error getting bill XML files list for {folder_url}: {e}")
-                error_count += 1
-                continue
+    # Get bill XML files from each range folder
+    bill_urls = []
+    error_count = 0
+    for folder_url, (bill_xmls, error) in zip(
+        range_folders,
+        ftp_connection.imap(list_folder, range_folders, max_workers=MAX_FTP_WORKERS),
+    ):
+        if error:
+            logger.debug(f"Error getting bill XML files list for {folder_url}: {error}")
+            error_count += 1
+            continue
+        bill_urls.extend(bill_xmls)
 
-        if error_count > max_errors:
-            logger.error(
-                f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -- Failed to get bill URLs for {error_count} chambers"
-            )
-            raise Exception(
-                f"Failed to get bill URLs for {error_count} chambers. Stopping process."
-            )
+    if error_count > max_errors:
+        logger.error(
+            f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -- Failed to get bill URLs for {error_count} chambers"
+        )
+        raise Exception(
+            f"Failed to get bill URLs for {error_count} chambers. Stopping process."
+        )
 
     return bill_urls
 
 
+def xml_text(elem):
+    """
+    Get the stripped text of an XML element, including any nested text.
+
+    Args:
+        elem: lxml Element, or None
+
+    Returns:
+        str: Stripped text of the element, or None if the element is missing
+    """
+    if elem is None:
+        return None
+    return "".join(elem.itertext()).strip()
+
+
 def parse_bill_xml(ftp_connection, url):
     """
     Parse bill XML data from a URL into a standardized dictionary format.
@@ -924,69 +1036,50 @@ def parse_bill_xml(ftp_connection, url):
         logger.debug(f"Recieved no data from {url}")
         return None
 
-    soup = BeautifulSoup(xml_str, "xml")
+    # get_data already decoded the file, so parse it as UTF-8 regardless of the
+    # declared encoding. recover=True keeps malformed files parseable.
+    parser = etree.XMLParser(encoding="utf-8", recover=True)
+    root = etree.fromstring(xml_str.encode("utf-8"), parser=parser)
+    if root is None:
+        return None
 
     # Check for error status
-    status = soup.find("status")
-    if status and "ERROR: Bill does not exist." in status.text:
+    status = next(root.iter("status"), None)
+    if status is not None and "ERROR: Bill does not exist." in xml_text(status):
         return None
 
     bill_data = {}
 
     # Basic bill info
-    bill_history = soup.find("billhistory")
-    if bill_history:
+    bill_history = next(root.iter("billhistory"), None)
+    if bill_history is not None:
         bill_data["bill_id"] = bill_history.get("bill")
         bill_data["last_update"] = bill_history.get("lastUpdate")
 
     # Last action
-    last_action = soup.find("lastaction")
-    if last_action:
-        bill_data["last_action"] = last_action.text.strip()
+    last_action = root.find(".//lastaction")
+    if last_action is not None:
+        bill_data["last_action"] = xml_text(last_action)
 
     # Caption
-    caption = soup.find("caption")
-    if caption:
-        bill_data["caption"] = caption.text.strip()
+    caption = root.find(".//caption")
+    if caption is not None:
+        bill_data["caption"] = xml_text(caption)
         bill_data["caption_version"] = caption.get("version")
 
-    # Authors and co-authors
-    authors_elem = soup.find("authors")
-    bill_data["authors"] = (
-        [a.strip() for a in authors_elem.text.strip().split("|") if a.strip()]
-        if authors_elem
-        else []
-    )
-
-    coauthors_elem = soup.find("coauthors")
-    bill_data["coauthors"] = (
-        [a.strip() for a in coauthors_elem.text.strip().split("|") if a.strip()]
-        if coauthors_elem
-        else []
-    )
-
-    sponsors_elem = soup.find("sponsors")
-    bill_data["sponsors"] = (
-        [a.strip() for a in sponsors_elem.text.strip().split("|") if a.strip()]
-        if sponsors_elem
-        else []
-    )
-
-    cosponsors_elem = soup.find("cosponsors")
-    bill_data["cosponsors"] = (
-        [a.strip() for a in cosponsors_elem.text.strip().split("|") if a.strip()]
-        if cosponsors_elem
-        else []
-    )
+    # Authors, co-authors, sponsors and co-sponsors are "|" separated lists
+    for field in ["authors", "coauthors", "sponsors", "cosponsors"]:
+        names = xml_text(root.find(f".//{field}")) or ""
+        bill_data[field] = [a.strip() for a in names.split("|") if a.strip()]
 
     # Subjects
-    bill_data["subjects"] = [s.text.strip() for s in soup.find_all("subject")]
+    bill_data["subjects"] = [xml_text(s) for s in root.iter("subject")]
 
     # Parse companions
-    companions = soup.find("companions")
+    companions = xml_text(root.find(".//companions"))
     bill_data["companions"] = []
-    if companions and companions.text.strip():
-        for companion in companions.text.strip().split("\n"):
+    if companions:
+        for companion in companions.split("\n"):
             companion = companion.strip()
             if companion:
                 # Extract bill ID, author and relationship
@@ -1007,11 +1100,11 @@ def parse_bill_xml(ftp_connection, url):
                     bill_data["companions"].append(companion_data)
 
     # Committee info
-    committees = soup.find("committees")
+    committees = root.find(".//committees")
     bill_data["committees"] = []
-    if committees:
-        for comm in committees.find_all():
-            committee_type = comm.name
+    if committees is not None:
+        for comm in committees.iterdescendants(etree.Element):
+            committee_type = comm.tag
             committee_data = {
                 "type": committee_type,
                 "name": comm.get("name"),
@@ -1027,148 +1120,32 @@ def parse_bill_xml(ftp_connection, url):
 
     # Actions
     bill_data["actions"] = []
-    for action in soup.find_all("action"):
-        action_number_elem = action.find("actionNumber")
-        date_elem = action.find("date")
-        description_elem = action.find("description")
-        comment_elem = action.find("comment")
-        timestamp_elem = action.find("actionTimestamp")
-
+    for action in root.iterfind(".//action"):
         action_data = {
-            "number": action_number_elem.text.strip() if action_number_elem else None,
-            "date": date_elem.text.strip() if date_elem else None,
-            "description": description_elem.text.strip() if description_elem else None,
-            "comment": comment_elem.text.strip() if comment_elem else None,
-            "timestamp": timestamp_elem.text.strip() if timestamp_elem else None,
+            "number": xml_text(action.find("actionNumber")),
+            "date": xml_text(action.find("date")),
+            "description": xml_text(action.find("description")),
+            "comment": xml_text(action.find("comment")),
+            "timestamp": xml_text(action.find("actionTimestamp")),
         }
         bill_data["actions"].append(action_data)
 
-    # Bill text URLs
+    # Bill text URLs from bill text, analysis and fiscal note versions
     bill_data["versions"] = []
-
-    # Get versions from bill text
-    billtext_elem = soup.find("billtext")
-    if billtext_elem:
-        doc_types_elem = billtext_elem.find("docTypes")
-        if doc_types_elem:
-            bill_elem = doc_types_elem.find("bill")
-            if bill_elem:
-                versions_elem = bill_elem.find("versions")
-                if versions_elem:
-                    bill_versions = versions_elem.find_all("version")
-                    for idx, version in enumerate(bill_versions):
-                        version_desc_elem = version.find("versionDescription")
-                        web_html_elem = version.find("WebHTMLURL")
-                        web_pdf_elem = version.find("WebPDFURL")
-                        ftp_html_elem = version.find("FTPHTMLURL")
-                        ftp_pdf_elem = version.find("FTPPDFURL")
-
-                        version_data = {
-                            "type": "Bill",
-                            "text_order": idx + 1,
-                            "description": (
-                                version_desc_elem.text.strip()
-                                if version_desc_elem
-                                else None
-                            ),
-                            "urls": {
-                                "web_html": (
-                                    web_html_elem.text.strip()
-                                    if web_html_elem
-                                    else None
-                                ),
-                                "web_pdf": (
-                                    web_pdf_elem.text.strip() if web_pdf_elem else None
-                                ),
-                                "ftp_html": (
-                                    ftp_html_elem.text.strip()
-                                    if ftp_html_elem
-                                    else None
-                                ),
-                                "ftp_pdf": (
-                                    ftp_pdf_elem.text.strip() if ftp_pdf_elem else None
-                                ),
-                            },
-                        }
-                        bill_data["versions"].append(version_data)
-
-    # Get versions from analysis
-    if billtext_elem and doc_types_elem:
-        analysis_elem = doc_types_elem.find("analysis")
-        if analysis_elem:
-            analysis_versions_elem = analysis_elem.find("versions")
-            if analysis_versions_elem:
-                analysis_versions = analysis_versions_elem.find_all("version")
-                for idx, version in enumerate(analysis_versions):
-                    version_desc_elem = version.find("versionDescription")
-                    web_html_elem = version.find("WebHTMLURL")
-                    web_pdf_elem = version.find("WebPDFURL")
-                    ftp_html_elem = version.find("FTPHTMLURL")
-                    ftp_pdf_elem = version.find("FTPPDFURL")
-
-                    version_data = {
-                        "type": "Analysis",
-                        "text_order": idx + 1,
-                        "description": (
-                            version_desc_elem.text.strip()
-                            if version_desc_elem
-                            else None
-                        ),
-                        "urls": {
-                            "web_html": (
-                                web_html_elem.text.strip() if web_html_elem else None
-                            ),
-                            "web_pdf": (
-                                web_pdf_elem.text.strip() if web_pdf_elem else None
-                            ),
-                            "ftp_html": (
-                                ftp_html_elem.text.strip() if ftp_html_elem else None
-                            ),
-                            "ftp_pdf": (
-                                ftp_pdf_elem.text.strip() if ftp_pdf_elem else None
-                            ),
-                        },
-                    }
-                    bill_data["versions"].append(version_data)
-
-    # Get versions from fiscal note
-    if billtext_elem and doc_types_elem:
-        fiscal_note_elem = doc_types_elem.find("fiscalNote")
-        if fiscal_note_elem:
-            fiscal_versions_elem = fiscal_note_elem.find("versions")
-            if fiscal_versions_elem:
-                fiscal_versions = fiscal_versions_elem.find_all("version")
-                for idx, version in enumerate(fiscal_versions):
-                    version_desc_elem = version.find("versionDescription")
-                    web_html_elem = version.find("WebHTMLURL")
-                    web_pdf_elem = version.find("WebPDFURL")
-                    ftp_html_elem = version.find("FTPHTMLURL")
-                    ftp_pdf_elem = version.find("FTPPDFURL")
-
-                    version_data = {
-                        "type": "Fiscal Note",
-                        "description": (
-                            version_desc_elem.text.strip()
-                            if version_desc_elem
-                            else None
-                        ),
-                        "text_order": idx + 1,
-                        "urls": {
-                            "web_html": (
-                                web_html_elem.text.strip() if web_html_elem else None
-                            ),
-                            "web_pdf": (
-                                web_pdf_elem.text.strip() if web_pdf_elem else None
-                            ),
-                            "ftp_html": (
-                                ftp_html_elem.text.strip() if ftp_html_elem else None
-                            ),
-                            "ftp_pdf": (
-                                ftp_pdf_elem.text.strip() if ftp_pdf_elem else None
-                            ),
-                        },
-                    }
-                    bill_data["versions"].append(version_data)
+    for doc in _DOC_TYPES_XP(root):
+        for idx, version in enumerate(_VERSIONS_XP(doc)):
+            version_data = {
+                "type": _DOC_TYPE_NAMES[doc.tag],
+                "text_order": idx + 1,
+                "description": xml_text(version.find("versionDescription")),
+                "urls": {
+                    "web_html": xml_text(version.find("WebHTMLURL")),
+                    "web_pdf": xml_text(version.find("WebPDFURL")),
+                    "ftp_html": xml_text(version.find("FTPHTMLURL")),
+                    "ftp_pdf": xml_text(version.find("FTPPDFURL")),
+                },
+            }
+            bill_data["versions"].append(version_data)
 
     return bill_data
 
@@ -1183,8 +1160,11 @@ def read_committee_meeting(meeting_url):
     Returns:
         dict: Dictionary containing committee info and list of bills to be discussed
     """
-    response = requests.get(meeting_url, timeout=20)
-    soup = BeautifulSoup(response.text, "html.parser")
+    meeting_html = fetch_page(meeting_url)
+    # Everything read below lives in tables, paragraphs or links
+    soup = BeautifulSoup(
+        meeting_html, "lxml", parse_only=SoupStrainer(["table", "tr", "p", "a"])
+    )
 
     # Find the first table with class MsoNormalTable
     tables = soup.find_all("table", class_="MsoNormalTable")
@@ -1200,20 +1180,20 @@ def read_committee_meeting(meeting_url):
     paragraphs = table.find_all("p", class_="MsoNormal")
     for p in paragraphs:
         text = p.get_text(" ", strip=True)
-        text = re.sub(r"\s+", " ", text)
-
-        if text.startswith("COMMITTEE:"):
-            meeting_data["committee"] = text.replace("COMMITTEE:", "").strip()
-        elif text.startswith("TIME & DATE:"):
-            meeting_data["time_date"] = text.replace("TIME & DATE:", "").strip()
-        elif text.startswith("PLACE:"):
-            place_chair = text.replace("PLACE:", "").strip()
-            if "CHAIR:" in place_chair:
-                place, chair = place_chair.split("CHAIR:")
-                meeting_data["place"] = place.strip()
-                meeting_data["chair"] = chair.strip()
-            else:
-                meeting_data["place"] = place_chair
+        text = _WS_RE.sub(" ", text)
+
+        field = _MEETING_FIELD_RE.match(text)
+        if not field:
+            continue
+
+        key = _MEETING_FIELD_KEYS[field.group(1)]
+        value = field.group(2).strip()
+        if key == "place" and "CHAIR:" in value:
+            place, chair = _CHAIR_RE.split(value, maxsplit=1)
+            meeting_data["place"] = place.strip()
+            meeting_data["chair"] = chair.strip()
+        else:
+            meeting_data[key] = value
 
     # Find all bill rows
     bill_rows = soup.find_all("tr", style="page-break-inside:avoid")
@@ -1232,22 +1212,24 @@ def read_committee_meeting(meeting_url):
         bill_id = bill_link.get_text(strip=True)
 
         # Get author text after </a> tag but before first <br> tag
-        author = ""
+        author_parts = []
         for content in bill_link.next_siblings:
             if content.name == "br":
                 break
-            author += str(content)
-        author = re.sub(r"[\r\n]", "", author.strip())
+            author_parts.append(
+                content if isinstance(content, str) else content.get_text()
+            )
+        author = _CRLF_RE.sub("", "".join(author_parts).strip())
         # Get description text between first and second <br> tags
         description = ""
         br_tags = bill_p.find_all("br")
         if len(br_tags) >= 2:
             description_content = br_tags[0].next_sibling
             if description_content and description_content.string:
-                description = re.sub(r"[\r\n]", "", description_content.string.strip())
+                description = _CRLF_RE.sub("", description_content.string.strip())
 
         # Extract LegSess from bill_href
-        leg_sess = re.search(r"LegSess=(\d+)", bill_href).group(1)
+        leg_sess = _LEG_SESS_RE.search(bill_href).group(1)
 
         meeting_data["bills"].append(
             {
@@ -1260,10 +1242,6 @@ def read_committee_meeting(meeting_url):
         )
 
     # Check for deleted and added bills sections
-    deleted_bills = []
-    added_bills = []
-
-    # Find headers for deleted and added bills
     deleted_header = soup.find(
         "p", class_="MsoNormal", string=lambda x: x and "Bills deleted" in x
     )
@@ -1271,28 +1249,40 @@ def read_committee_meeting(meeting_url):
         "p", class_="MsoNormal", string=lambda x: x and "Bills added" in x
     )
 
-    # Get deleted bills if they exist
-    if deleted_header:
-        # Get all bill links between deleted header and added header (if it exists)
-        next_header = added_header if added_header else None
-        current = deleted_header.find_next("a")
-        while current and current != next_header:
-            deleted_bill_id = current.get_text(strip=True)
-            deleted_bill_href = "https://capitol.texas.gov" + current["href"]
-            deleted_bills.append(
-                {"bill_id": deleted_bill_id, "bill_link": deleted_bill_href}
-            )
-            current = current.find_next("a")
-
-    # Get added bills if they exist
-    if added_header:
-        # Get all bill links after added header
-        current = added_header.find_next("a")
-        while current:
-            added_bill_id = current.get_text(strip=True)
-            added_bill_href = "https://capitol.texas.gov" + current["href"]
-            added_bills.append({"bill_id": added_bill_id, "bill_link": added_bill_href})
-            current = current.find_next("a")
+    # Collect every link once and slice it by header position, rather than
+    # walking the document with find_next for each bill
+    links = soup.find_all("a")
+    link_positions = {id(link): i for i, link in enumerate(links)}
+
+    def first_link_after(header):
+        if header is None:
+            return len(links)
+        link = header.find_next("a")
+        return link_positions[id(link)] if link is not None else len(links)
+
+    deleted_start = first_link_after(deleted_header)
+    added_start = first_link_after(added_header)
+
+    # Deleted bills run up to the added header (if it follows), added bills
+    # run to the end of the page
+    deleted_end = added_start if added_start > deleted_start else len(links)
+    deleted_links = links[deleted_start:deleted_end] if deleted_header else []
+    added_links = links[added_start:]
+
+    deleted_bills = [
+        {
+            "bill_id": link.get_text(strip=True),
+            "bill_link": "https://capitol.texas.gov" + link["href"],
+        }
+        for link in deleted_links
+    ]
+    added_bills = [
+        {
+            "bill_id": link.get_text(strip=True),
+            "bill_link": "https://capitol.texas.gov" + link["href"],
+        }
+        for link in added_links
+    ]
 
     meeting_data["deleted_bills"] = deleted_bills
     meeting_data["added_bills"] = added_bills
@@ -1306,6 +1296,51 @@ def read_committee_meeting(meeting_url):
 ########################################################
 
 
+def explode_bill_column(raw_bills_df, column):
+    """
+    Explode a list column of the raw bills data into one row per list item.
+
+    Args:
+        raw_bills_df (pd.DataFrame): DataFrame containing raw bill data
+        column (str): Name of a column holding a list for each bill
+
+    Returns:
+        pd.DataFrame: bill_id, leg_id and column, one row per list item, keeping
+            the raw_bills_df index. Bills with an ID that can't be cleaned or with
+            no items are left out.
+    """
+    bill_ids, leg_ids = get_clean_bill_ids(raw_bills_df)
+    exploded = pd.DataFrame(
+        {"bill_id": bill_ids, "leg_id": leg_ids, column: raw_bills_df[column]}
+    )
+    exploded = exploded[bill_ids.fillna("").ne("")].explode(column)
+    return exploded[exploded[column].notna()]
+
+
+def explode_bill_records(raw_bills_df, column, fields):
+    """
+    Flatten a column of lists of dicts in the raw bills data into a DataFrame.
+
+    Args:
+        raw_bills_df (pd.DataFrame): DataFrame containing raw bill data
+        column (str): Name of a column holding a list of dicts for each bill
+        fields (dict): Map of dict keys to output columns. Nested keys are
+            joined with dots, like 'votes.aye'.
+
+    Returns:
+        pd.DataFrame: DataFrame with bill_id, leg_id and the output columns
+    """
+    exploded = explode_bill_column(raw_bills_df, column)
+    flat = (
+        pd.json_normalize(exploded[column].tolist())
+        .reindex(columns=list(fields))
+        .rename(columns=fields)
+    )
+    return pd.concat(
+        [exploded[["bill_id", "leg_id"]].reset_index(drop=True), flat], axis=1
+    )
+
+
 def get_bills_data(raw_bills_df):
     """
     Extract core bill data from raw bills dataframe into standardized format.
@@ -1316,38 +1351,33 @@ def get_bills_data(raw_bills_df):
     Returns:
         pd.DataFrame: DataFrame with columns bill_id, leg_id, caption, last_action, caption_version
     """
-    bills_data = []
-    for _, row in raw_bills_df.iterrows():
-        try:
-            bill_id, leg_id = clean_bill_id(row["bill_id"])
-            bills_data.append(
-                {
-                    "bill_id": bill_id,
-                    "leg_id": leg_id,
-                    "caption": row["caption"],
-                    "last_action_date": row["last_action"].split(" ")[0],
-                    "last_action_chamber": row["last_action"].split(" ")[1],
-                    "last_action": " ".join(row["last_action"].split(" ")[2:]),
-                    "caption_version": row["caption_version"],
-                }
-            )
-        except Exception as e:
-            logger.debug(f"Failed to get clean bill data for {row['bill_id']}: {e}")
-            continue
+    bill_ids, leg_ids = get_clean_bill_ids(raw_bills_df)
+    # Last action looks like '03/01/2025 H Filed': date, chamber, then the action
+    last_action_parts = (
+        raw_bills_df["last_action"]
+        .str.split(" ", n=2, expand=True)
+        .reindex(columns=[0, 1, 2])
+    )
 
-    return pd.DataFrame(
-        bills_data,
-        columns=[
-            "bill_id",
-            "leg_id",
-            "caption",
-            "last_action",
-            "last_action_date",
-            "last_action_chamber",
-            "caption_version",
-        ],
+    bills_data = pd.DataFrame(
+        {
+            "bill_id": bill_ids,
+            "leg_id": leg_ids,
+            "caption": raw_bills_df["caption"],
+            "last_action": last_action_parts[2].fillna(""),
+            "last_action_date": last_action_parts[0],
+            "last_action_chamber": last_action_parts[1],
+            "caption_version": raw_bills_df["caption_version"],
+        }
     )
 
+    # Skip bills whose ID or last action can't be split
+    valid = bill_ids.fillna("").ne("") & last_action_parts[1].notna()
+    for bill_id in raw_bills_df.loc[~valid, "bill_id"]:
+        logger.debug(f"Failed to get clean bill data for {bill_id}")
+
+    return bills_data[valid].reset_index(drop=True)
+
 
 def get_actions_data(raw_bills_df):
     """
@@ -1359,74 +1389,34 @@ def get_actions_data(raw_bills_df):
     Returns:
         pd.DataFrame: DataFrame with action information
     """
-    actions_data = []
-    for _, row in raw_bills_df.iterrows():
-        try:
-            bill_id, leg_id = clean_bill_id(row["bill_id"])
-
-            # Skip if no actions
-            if not row["actions"]:
-                continue
-
-            for action in row["actions"]:
-                actions_data.append(
-                    {
-                        "bill_id": bill_id,
-                        "leg_id": leg_id,
-                        "action_number": action["number"],
-                        "action_date": action["date"],
-                        "description": action["description"],
-                        "comment": action["comment"],
-                        "action_timestamp": action.get("timestamp", None),
-                    }
-                )
-        except Exception as e:
-            logger.debug(f"Failed to get clean action data for {row['bill_id']}: {e}")
-            continue
-
-    return pd.DataFrame(
-        actions_data,
-        columns=[
-            "bill_id",
-            "leg_id",
-            "action_number",
-            "action_date",
-            "description",
-            "comment",
-            "action_timestamp",
-        ],
+    return explode_bill_records(
+        raw_bills_df,
+        "actions",
+        {
+            "number": "action_number",
+            "date": "action_date",
+            "description": "description",
+            "comment": "comment",
+            "timestamp": "action_timestamp",
+        },
     )
 
 
 def get_authors_data(raw_bills_df):
-    authors_data = []
-    for _, row in raw_bills_df.iterrows():
-        try:
-            bill_id, leg_id = clean_bill_id(row["bill_id"])
-            for author in row["authors"]:
-                authors_data.append(
-                    {
-                        "bill_id": bill_id,
-                        "leg_id": leg_id,
-                        "author": author,
-                        "author_type": "Author",
-                    }
-                )
-            for coauthor in row["coauthors"]:
-                authors_data.append(
-                    {
-                        "bill_id": bill_id,
-                        "leg_id": leg_id,
-                        "author": coauthor,
-                        "author_type": "Coauthor",
-                    }
-                )
-        except Exception as e:
-            logger.debug(f"Failed to get clean author data for {row['bill_id']}: {e}")
-            continue
-
-    return pd.DataFrame(
-        authors_data, columns=["bill_id", "leg_id", "author", "author_type"]
+    authors = explode_bill_column(raw_bills_df, "authors").rename(
+        columns={"authors": "author"}
+    )
+    coauthors = explode_bill_column(raw_bills_df, "coauthors").rename(
+        columns={"coauthors": "author"}
+    )
+    authors["author_type"] = "Author"
+    coauthors["author_type"] = "Coauthor"
+
+    # Stable sort on the raw bills index keeps each bill's authors together,
+    # authors before coauthors
+    authors_data = pd.concat([authors, coauthors]).sort_index(kind="stable")
+    return authors_data[["bill_id", "leg_id", "author", "author_type"]].reset_index(
+        drop=True
     )
 
 
@@ -1440,34 +1430,20 @@ def get_sponsors_data(raw_bills_df):
     Returns:
         pd.DataFrame: DataFrame with columns bill_id, leg_id, sponsor, sponsor_type
     """
-    sponsors_data = []
-    for _, row in raw_bills_df.iterrows():
-        try:
-            bill_id, leg_id = clean_bill_id(row["bill_id"])
-            for sponsor in row["sponsors"]:
-                sponsors_data.append(
-                    {
-                        "bill_id": bill_id,
-                        "leg_id": leg_id,
-                        "sponsor": sponsor,
-                        "sponsor_type": "Sponsor",
-                    }
-                )
-            for cosponsor in row["cosponsors"]:
-                sponsors_data.append(
-                    {
-                        "bill_id": bill_id,
-                        "leg_id": leg_id,
-                        "sponsor": cosponsor,
-                        "sponsor_type": "cosponsor",
-                    }
-                )
-        except Exception as e:
-            logger.debug(f"Failed to get clean sponsor data for {row['bill_id']}: {e}")
-            continue
-
-    return pd.DataFrame(
-        sponsors_data, columns=["bill_id", "leg_id", "sponsor", "sponsor_type"]
+    sponsors = explode_bill_column(raw_bills_df, "sponsors").rename(
+        columns={"sponsors": "sponsor"}
+    )
+    cosponsors = explode_bill_column(raw_bills_df, "cosponsors").rename(
+        columns={"cosponsors": "sponsor"}
+    )
+    sponsors["sponsor_type"] = "Sponsor"
+    cosponsors["sponsor_type"] = "cosponsor"
+
+    # Stable sort on the raw bills index keeps each bill's sponsors together,
+    # sponsors before cosponsors
+    sponsors_data = pd.concat([sponsors, cosponsors]).sort_index(kind="stable")
+    return sponsors_data[["bill_id", "leg_id", "sponsor", "sponsor_type"]].reset_index(
+        drop=True
     )
 
 
@@ -1482,34 +1458,25 @@ def get_subjects_data(raw_bills_df):
     Returns:
         pd.DataFrame: DataFrame with columns bill_id, leg_id, subject_title, subject_id
     """
-    subjects_data = []
-    for _, row in raw_bills_df.iterrows():
-        try:
-            bill_id, leg_id = clean_bill_id(row["bill_id"])
-            for subject in row["subjects"]:
-                # Split subject into title and ID
-                # Example: "City Government--Employees/Officers (I0061)"
-                title = subject.split(" (")[0]  # Everything before the ID
-                subject_id = subject.split("(")[1].rstrip(
-                    ")"
-                )  # Extract ID without parentheses
-
-                subjects_data.append(
-                    {
-                        "bill_id": bill_id,
-                        "leg_id": leg_id,
-                        "subject_title": title,
-                        "subject_id": subject_id,
-                    }
-                )
-        except Exception as e:
-            logger.debug(f"Failed to get clean subject data for {row['bill_id']}: {e}")
-            continue
-
-    return pd.DataFrame(
-        subjects_data, columns=["bill_id", "leg_id", "subject_title", "subject_id"]
+    subjects = explode_bill_column(raw_bills_df, "subjects")
+    # Split subject into title and ID
+    # Example: "City Government--Employees/Officers (I0061)"
+    parts = subjects["subjects"].str.extract(_SUBJECT_RE)
+    subjects_data = pd.DataFrame(
+        {
+            "bill_id": subjects["bill_id"],
+            "leg_id": subjects["leg_id"],
+            "subject_title": parts[0],
+            "subject_id": parts[1],
+        }
     )
 
+    valid = parts[1].notna()
+    for subject in subjects.loc[~valid, "subjects"]:
+        logger.debug(f"Failed to get clean subject data for {subject}")
+
+    return subjects_data[valid].reset_index(drop=True)
+
 
 def get_companions_data(raw_bills_df):
     """
@@ -1521,33 +1488,10 @@ def get_companions_data(raw_bills_df):
     Returns:
         pd.DataFrame: DataFrame with columns bill_id, leg_id, companion_bill_id
     """
-    companions_data = []
-    for _, row in raw_bills_df.iterrows():
-        try:
-            bill_id, leg_id = clean_bill_id(row["bill_id"])
-
-            # Skip if no companions
-            if not row["companions"]:
-                continue
-
-            for companion in row["companions"]:
-                companions_data.append(
-                    {
-                        "bill_id": bill_id,
-                        "leg_id": leg_id,
-                        "companion_bill_id": companion["bill_id"],
-                        "relationship": companion["relationship"],
-                    }
-                )
-        except Exception as e:
-            logger.debug(
-                f"Failed to get clean companion data for {row['bill_id']}: {e}"
-            )
-            continue
-
-    return pd.DataFrame(
-        companions_data,
-        columns=["bill_id", "leg_id", "companion_bill_id", "relationship"],
+    return explode_bill_records(
+        raw_bills_df,
+        "companions",
+        {"bill_id": "companion_bill_id", "relationship": "relationship"},
     )
 
 
@@ -1561,100 +1505,34 @@ def get_committee_status_data(raw_bills_df):
     Returns:
         pd.DataFrame: DataFrame with committee information
     """
-    committees_data = []
-
-    for _, row in raw_bills_df.iterrows():
-        try:
-            bill_id, leg_id = clean_bill_id(row["bill_id"])
-
-            # Skip if no committees
-            if not row["committees"]:
-                continue
-
-            for committee in row["committees"]:
-                votes = committee.get("votes", {})
-                committees_data.append(
-                    {
-                        "bill_id": bill_id,
-                        "leg_id": leg_id,
-                        "chamber": committee.get("type"),
-                        "name": committee.get("name"),
-                        #'subcommittee_name': None,  # Not in sample data but included for schema
-                        "status": committee.get("status"),
-                        #'subcommittee_status': None,  # Not in sample data but included for schema
-                        "aye_votes": votes.get("aye", 0),
-                        "nay_votes": votes.get("nay", 0),
-                        "present_votes": votes.get("present_not_voting", 0),
-                        "absent_votes": votes.get("absent", 0),
-                    }
-                )
-
-        except Exception as e:
-            logger.debug(
-                f"Failed to get clean committee votes data for {row['bill_id']}: {e}"
-            )
-            continue
-
-    return pd.DataFrame(
-        committees_data,
-        columns=[
-            "bill_id",
-            "leg_id",
-            "chamber",
-            "name",
-            "status",  #'subcommittee_name', 'subcommittee_status',
-            "aye_votes",
-            "nay_votes",
-            "present_votes",
-            "absent_votes",
-        ],
+    return explode_bill_records(
+        raw_bills_df,
+        "committees",
+        {
+            "type": "chamber",
+            "name": "name",
+            "status": "status",
+            "votes.aye": "aye_votes",
+            "votes.nay": "nay_votes",
+            "votes.present_not_voting": "present_votes",
+            "votes.absent": "absent_votes",
+        },
     )
 
 
 def get_versions_data(raw_bills_df):
-    versions_data = []
-
-    for _, row in raw_bills_df.iterrows():
-        try:
-            bill_id, leg_id = clean_bill_id(row["bill_id"])
-
-            # Skip if no versions
-            if not row["versions"]:
-                continue
-
-            for version in row["versions"]:
-                # Extract URLs, defaulting to None if not present
-                urls = version.get("urls", {})
-                versions_data.append(
-                    {
-                        "bill_id": bill_id,
-                        "leg_id": leg_id,
-                        "type": version.get("type"),
-                        "text_order": version.get("text_order"),
-                        "description": version.get("description"),
-                        "html_url": urls.get("web_html"),
-                        "pdf_url": urls.get("web_pdf"),
-                        "ftp_html_url": urls.get("ftp_html"),
-                        "ftp_pdf_url": urls.get("ftp_pdf"),
-                    }
-                )
-        except Exception as e:
-            logger.debug(f"Failed to get clean version data for {row['bill_id']}: {e}")
-            continue
-
-    return pd.DataFrame(
-        versions_data,
-        columns=[
-            "bill_id",
-            "leg_id",
-            "type",
-            "text_order",
-            "description",
-            "html_url",
-            "pdf_url",
-            "ftp_html_url",
-            "ftp_pdf_url",
-        ],
+    return explode_bill_records(
+        raw_bills_df,
+        "versions",
+        {
+            "type": "type",
+            "text_order": "text_order",
+            "description": "description",
+            "urls.web_html": "html_url",
+            "urls.web_pdf": "pdf_url",
+            "urls.ftp_html": "ftp_html_url",
+            "urls.ftp_pdf": "ftp_pdf_url",
+        },
     )
 
 
@@ -1671,64 +1549,48 @@ def get_links_data(raw_bills_df):
         "bill_stages": "https://capitol.texas.gov/BillLookup/BillStages.aspx",
     }
 
-    links_data = []
-
-    for _, row in raw_bills_df.iterrows():
-        try:
-            bill_id, leg_id = clean_bill_id(row["bill_id"])
+    bill_ids, leg_ids = get_clean_bill_ids(raw_bills_df)
+    valid = bill_ids.fillna("").ne("")
+    links_data = pd.DataFrame({"bill_id": bill_ids[valid], "leg_id": leg_ids[valid]})
+
+    for link_type, base_url in base_urls.items():
+        # Format URL with session and bill info
+        links_data[link_type] = (
+            base_url
+            + "?LegSess="
+            + links_data["leg_id"]
+            + "&Bill="
+            + links_data["bill_id"]
+        )
 
-            # Build links dictionary
-            links = {
-                "bill_id": bill_id,
-                "leg_id": leg_id,
-            }
-            for link_type, base_url in base_urls.items():
-                # Format URL with session and bill info
-                formatted_url = f"{base_url}?LegSess={leg_id}&Bill={bill_id}"
-                links[link_type] = formatted_url
+    return links_data.reset_index(drop=True)
 
-            links_data.append(links)
-        except Exception as e:
-            logger.debug(f"Failed to create clean links data for {row['bill_id']}: {e}")
-            continue
 
-    return pd.DataFrame(
-        links_data, columns=["bill_id", "leg_id"] + list(base_urls.keys())
+def get_complete_bills_list(raw_bills_df):
+    # Extract and clean bill_id and leg_id
+    bill_ids, leg_ids = get_clean_bill_ids(raw_bills_df)
+    cleaned_df = pd.DataFrame({"bill_id": bill_ids, "leg_id": leg_ids})
+    cleaned_df = cleaned_df.dropna(subset=["leg_id"])
+
+    # Split e.g. 'HB1' into its letter prefix and number
+    cleaned_df["prefix"] = cleaned_df["bill_id"].str.rstrip(string.digits)
+    cleaned_df["number"] = (
+        cleaned_df["bill_id"].str.lstrip(string.ascii_uppercase).astype(int)
     )
 
+    # Highest bill number for each session and prefix
+    max_bills = cleaned_df.groupby(["leg_id", "prefix"])["number"].max().reset_index()
 
-def get_complete_bills_list(raw_bills_df):
-    new_rows = []
-
-    # Extract and clean bill_id and leg_id
-    cleaned_data = []
-    for _, row in raw_bills_df.iterrows():
-        bill_id, leg_id = clean_bill_id(row["bill_id"])
-        cleaned_data.append((bill_id, leg_id))
-
-    cleaned_df = pd.DataFrame(cleaned_data, columns=["bill_id", "leg_id"])
-
-    # Group by legislative session
-    for leg_id, group in cleaned_df.groupby("leg_id"):
-        bill_types = group["bill_id"].str.extract(
-            r"([A-Z]+)(\d+)"
-        )  # Extract prefix and number
-        group["prefix"] = bill_types[0]
-        group["number"] = bill_types[1].astype(int)
-
-        # Ensure each prefix has a consecutive sequence
-        for prefix, sub_group in group.groupby("prefix"):
-            min_bill = 1  # sub_group["number"].min()
-            max_bill = sub_group["number"].max()
-            print(f"Prefix: {prefix}, Min: {min_bill}, Max: {max_bill}")
-            full_range = pd.DataFrame(
-                {
-                    "bill_id": [f"{prefix}{i}" for i in range(min_bill, max_bill + 1)],
-                    "leg_id": leg_id,
-                }
-            )
-            new_rows.append(full_range)
-    return pd.concat(new_rows, ignore_index=True)
+    # Ensure each prefix has a consecutive sequence starting at 1, built by
+    # repeating each group max times and numbering the copies
+    full_range = max_bills.loc[max_bills.index.repeat(max_bills["number"])]
+    numbers = full_range.groupby(level=0).cumcount() + 1
+    return pd.DataFrame(
+        {
+            "bill_id": full_range["prefix"] + numbers.astype(str),
+            "leg_id": full_range["leg_id"],
+        }
+    ).reset_index(drop=True)
 
 
 def get_upcoming_committee_meetings():
@@ -1768,6 +1630,35 @@ def get_upcoming_committee_meetings():
         )
 
 
+def explode_meeting_bills(meetings_df):
+    """
+    Flatten committee meetings into one row per bill on the meeting's agenda.
+
+    The leg_id comes from each bill rather than the meeting URL, since TLO
+    lies about the leg_id in special session meeting URLs. Bills without a
+    leg_id (deleted and added bills) are left out.
+
+    Args:
+        meetings_df (pd.DataFrame): Meetings with a 'bills' column holding a
+            list of bill dicts for each meeting
+
+    Returns:
+        pd.DataFrame: DataFrame with the meeting details and bill columns
+    """
+    meeting_columns = ["committee", "chamber", "date", "time", "meeting_url"]
+    bill_columns = ["bill_id", "leg_id", "link", "author", "description", "status"]
+    if meetings_df is None or "bills" not in meetings_df.columns:
+        return pd.DataFrame(columns=meeting_columns + bill_columns)
+
+    exploded = meetings_df[meeting_columns + ["bills"]].explode("bills")
+    exploded = exploded[exploded["bills"].map(lambda bill: isinstance(bill, dict))]
+    bills = pd.json_normalize(exploded["bills"].tolist()).reindex(columns=bill_columns)
+    bills_df = pd.concat(
+        [exploded[meeting_columns].reset_index(drop=True), bills], axis=1
+    )
+    return bills_df.dropna(subset=["bill_id", "leg_id", "link"]).reset_index(drop=True)
+
+
 def get_upcoming_committee_meeting_bills():
     rss_upcoming = {
         "calendar_senate": "https://capitol.texas.gov/MyTLO/RSS/RSS.aspx?Type=upcomingcalendarssenate",
@@ -1776,68 +1667,7 @@ def get_upcoming_committee_meeting_bills():
         "meetings_house": "https://capitol.texas.gov/MyTLO/RSS/RSS.aspx?Type=upcomingmeetingshouse",
     }
     upcoming_meetings_df = get_rss_committee_meetings()
-
-    # Create list to store flattened bill records
-    bills_list = []
-
-    # Iterate through meetings and their bills
-    for _, meeting in upcoming_meetings_df.iterrows():
-        try:
-            # Get meeting details
-            meeting_details = {
-                "committee": meeting["committee"],
-                "chamber": meeting["chamber"],
-                "date": meeting["date"],
-                "time": meeting["time"],
-                "meeting_url": meeting["meeting_url"],
-            }
-
-            # Add each bill with meeting details
-            for bill in meeting["bills"]:
-                try:
-                    bill_record = meeting_details.copy()
-                    # Extract leg_id from link using regex
-                    # leg_id = re.search(r'/tlodocs/(\w+)/', meeting['meeting_url']).group(1) # Commenting this out because TLO lies about the leg_id for special sessions. Why is TLO like this???
-                    bill_record.update(
-                        {
-                            "bill_id": bill["bill_id"],
-                            "leg_id": bill["leg_id"],
-                            "link": bill["link"],
-                            "author": bill.get("author", None),
-                            "description": bill.get("description", None),
-                            "status": bill.get("status", None),
-                        }
-                    )
-                    bills_list.append(bill_record)
-                except Exception as e:
-                    print(
-                        f"Error processing upcoming meeting bill {bill['bill_id']}: {e}"
-                    )
-        except Exception as e:
-            logger.debug(
-                f"Failed to get clean upcoming committee meeting bills data from RSS for {meeting['meeting_url']}: {e}"
-            )
-            continue
-
-    if len(bills_list) <= 0:
-        return pd.DataFrame(
-            columns=[
-                "committee",
-                "chamber",
-                "date",
-                "time",
-                "meeting_url",
-                "bill_id",
-                "leg_id",
-                "link",
-                "author",
-                "description",
-                "status",
-            ]
-        )
-    # Convert to DataFrame
-    bills_df = pd.DataFrame(bills_list)
-    return bills_df
+    return explode_meeting_bills(upcoming_meetings_df)
 
 
 @task(retries=3, retry_delay_seconds=10, log_prints=False, cache_policy=NO_CACHE)
@@ -1868,92 +1698,60 @@ def get_committee_meetings_data(leg_session):
 
 def get_committee_meeting_bills_data(leg_session):
     upcoming_meetings_df = get_html_committee_meetings(leg_session)
-
-    # Create list to store flattened bill records
-    bills_list = []
-
-    # Iterate through meetings and their bills
-    for _, meeting in upcoming_meetings_df.iterrows():
-        # Get meeting details
-        meeting_details = {
-            "committee": meeting["committee"],
-            "chamber": meeting["chamber"],
-            "date": meeting["date"],
-            "time": meeting["time"],
-            "meeting_url": meeting["meeting_url"],
-        }
-
-        # Add each bill with meeting details
-        for bill in meeting["bills"]:
-            try:
-                bill_record = meeting_details.copy()
-                # Extract leg_id from link using regex
-                # leg_id = re.search(r'/tlodocs/(\w+)/', meeting['meeting_url']).group(1)
-                bill_record.update(
-                    {
-                        "bill_id": bill["bill_id"],
-                        "leg_id": bill["leg_id"],
-                        "link": bill["link"],
-                        "author": bill.get("author", None),
-                        "description": bill.get("description", None),
-                        "status": bill.get("status", None),
-                    }
-                )
-                bills_list.append(bill_record)
-            except Exception as e:
-                logger.debug(
-                    f"Failed to get upcoming committee meeting bills data from HTML for {meeting['meeting_url']}: {e}"
-                )
-
-    # Convert to DataFrame
-    bills_df = pd.DataFrame(bills_list)
-    return bills_df
+    return explode_meeting_bills(upcoming_meetings_df)
 
 
 @task(retries=0, retry_delay_seconds=10, log_prints=True, cache_policy=NO_CACHE)
 def get_bill_texts(ftp_conn, dataset_id, env, max_errors=5):
-    # Check if curr_bill_texts table exists
-    curr_bill_texts_df = get_current_table_data(
-        PROJECT_ID, dataset_id, "bill_texts", env
-    )
-    curr_versions_df = get_current_table_data(PROJECT_ID, dataset_id, "versions", env)
+    if env == "dev":
+        dataset_id = f"dev_{dataset_id}"
+    versions_table = f"`{PROJECT_ID}.{dataset_id}.versions`"
+    bill_texts_table = f"`{PROJECT_ID}.{dataset_id}.bill_texts`"
 
-    if curr_bill_texts_df is None and curr_versions_df is None:
-        logger.error(
-            f"No table found in {dataset_id}.bill_texts or {dataset_id}.versions"
-        )
-        raise ValueError(
-            f"No table found in {dataset_id}.bill_texts or {dataset_id}.versions"
-        )
-    elif curr_versions_df is None:
-        logger.error(
-            f"No table found in {dataset_id}.versions. Unable to get urls for bill texts"
-        )
-        raise ValueError(
-            f"No table found in {dataset_id}.versions. Unable to get urls for bill texts"
+    # Only pull the urls that still need text, rather than both full tables.
+    # NOT EXISTS rather than NOT IN, which matches nothing once the subquery
+    # returns a NULL url
+    try:
+        pdf_urls = query_bq(f"""
+SELECT v.ftp_pdf_url
+FROM {versions_table} AS v
+WHERE v.ftp_pdf_url IS NOT NULL
+    AND NOT EXISTS (
+        SELECT 1
+        FROM {bill_texts_table} AS t
+        WHERE t.ftp_pdf_url = v.ftp_pdf_url
+            AND t.text IS NOT NULL
+    )
+GROUP BY 1
+""")
+    except ValueError as e:
+        logger.warning(
+            f"Could not diff {dataset_id}.versions against {dataset_id}.bill_texts, getting text for every version: {e}"
         )
-    elif curr_bill_texts_df is None:
-        pdf_urls = duckdb.sql(
-            f"select ftp_pdf_url from curr_versions_df group by 1;"
-        ).df()
-    else:
-        pdf_urls = duckdb.sql(
-            f"select ftp_pdf_url from curr_versions_df where ftp_pdf_url not in (select ftp_pdf_url from curr_bill_texts_df where text is not null) group by 1;"
-        ).df()
+        try:
+            pdf_urls = query_bq(f"SELECT ftp_pdf_url FROM {versions_table} GROUP BY 1")
+        except ValueError as e:
+            logger.error(
+                f"Unable to get urls for bill texts from {dataset_id}.versions: {e}"
+            )
+            raise ValueError(
+                f"Unable to get urls for bill texts from {dataset_id}.versions: {e}"
+            ) from e
+
+    pdf_urls = pdf_urls["ftp_pdf_url"].tolist() if len(pdf_urls) > 0 else []
 
-    pdf_urls = pdf_urls["ftp_pdf_url"].tolist()
+    def get_pdf_text(connection, url):
+        return connection.get_pdf_text(url)
 
+    # PDFs are fetched over several FTP connections; results keep URL order
     pdf_texts = []
     error_count = 0
-    for url in pdf_urls:
-        # some logging
-        print(url)
-
-        try:
-            print(f"Getting PDF text for {url}")
-            pdf_text = ftp_conn.get_pdf_text(url)
-        except Exception as e:
-            logger.debug(f"Failed to get PDF text for {url}: {e}")
+    for url, (pdf_text, error) in zip(
+        pdf_urls,
+        ftp_conn.imap(get_pdf_text, pdf_urls, max_workers=MAX_FTP_WORKERS),
+    ):
+        if error:
+            logger.debug(f"Failed to get PDF text for {url}: {error}")
             error_count += 1
             continue
 
@@ -1995,22 +1793,27 @@ def get_raw_bills_data(leg_session, max_errors=5):
             f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -- Failed to get bill URLs: {e}"
         )
         raise Exception(f"Failed to get bill URLs: {e}")
+
+    # Bills are fetched over several FTP connections; results keep URL order.
+    # The error count is checked as results arrive, and closing the results
+    # cancels the remaining downloads once it is exceeded.
     raw_bills = []
     error_count = 0
-    for url in bill_urls:
-        try:
+    with contextlib.closing(
+        ftp_connection.imap(parse_bill_xml, bill_urls, max_workers=MAX_FTP_WORKERS)
+    ) as results:
+        for url, (bill_data, error) in zip(bill_urls, results):
             print(url)
-            bill_data = parse_bill_xml(ftp_connection, url)
-            if bill_data:
+            if error:
+                print(f"Error getting bill data for {url}: {error}")
+                error_count += 1
+            elif bill_data:
                 raw_bills.append(bill_data)
-        except Exception as e:
-            print(f"Error getting bill data for {url}: {e}")
-            error_count += 1
-        if error_count > max_errors:
-            print(
-                f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -- Failed to get bill data for {error_count} bills"
-            )
-            raise Exception(f"Failed to get bill data for {error_count} bills")
+            if error_count > max_errors:
+                print(
+                    f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -- Failed to get bill data for {error_count} bills"
+                )
+                raise Exception(f"Failed to get bill data for {error_count} bills")
     logger.info(
         f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -- Finished raw bills data extraction"
     )
@@ -10,6 +10,7 @@ from pipelines.flows.custom_gsheets import upload_call2action
 from pipelines.flows.pull_legiscan_data import legiscan_to_bigquery
 from pipelines.flows.tlo_scraper.extract_functions import *
 from pipelines.utils.utils import (
+    YAML_LOADER,
     dataframe_to_bigquery,
     determine_git_environment,
     get_secret,
@@ -54,7 +55,7 @@ def download_google_sheet(google_sheets_id, worksheet_name, output_table_id):
 @task(retries=0, retry_delay_seconds=10, log_prints=True, cache_policy=NO_CACHE)
 def download_google_sheets(gsheets_config_path):
     with open(gsheets_config_path, "r") as file:
-        gsheets_config = yaml.safe_load(file)
+        gsheets_config = yaml.load(file, Loader=YAML_LOADER)
 
     for download in gsheets_config["downloads"]:
         download_google_sheet(
@@ -533,7 +534,7 @@ def tx_leg_pipeline(env=None):
     print("USING ENV: ", ENV)
 
     with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YAML_LOADER)
 
     leg_session = config["info"]["LegSess"]
 
@@ -559,7 +560,7 @@ def tx_leg_pipeline(env=None):
         logger.info(
             f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -- Starting raw bills data extraction"
         )
-        raw_bills_df = get_raw_bills_data(leg_session)
+        raw_bills_df = attach_bill_ids(get_raw_bills_data(leg_session))
         logger.info("Raw bills data extraction complete")
     except Exception as e:
         logger.error(
@@ -1,13 +1,13 @@
 import os
 import zipfile
 
-import pandas as pd
 import requests
 
 from pipelines.utils.utils import (
     dataframe_to_bigquery,
     determine_git_environment,
     get_secret,
+    read_csv_as_strings,
 )
 
 CAMPAIGN_FINANCE_URL = (
@@ -24,46 +24,65 @@ def load_campaign_finance_data():
     os.makedirs("./data/temp_data/", exist_ok=True)
     os.makedirs("./data/temp_data/tx_campaign_finance", exist_ok=True)
 
-    # Download the campaign finance data
-    response = requests.get(CAMPAIGN_FINANCE_URL)
-    if response.status_code == 200:
-        zip_path = "./data/temp_data/tx_campaign_finance/TEC_CF_CSV.zip"
+    # Download the campaign finance data, streaming it straight to disk
+    zip_path = "./data/temp_data/tx_campaign_finance/TEC_CF_CSV.zip"
+    with requests.get(CAMPAIGN_FINANCE_URL, stream=True) as response:
+        if response.status_code != 200:
+            raise Exception(f"Failed to download data: {response.status_code}")
+
         # Save zip file
         with open(zip_path, "wb") as f:
-            f.write(response.content)
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                f.write(chunk)
 
-        # Extract zip contents
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall("./data")
+    # Extract zip contents
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        zip_ref.extractall("./data")
 
-        # Remove zip file after extraction
-        os.remove(zip_path)
-    else:
-        raise Exception(f"Failed to download data: {response.status_code}")
+    # Remove zip file after extraction
+    os.remove(zip_path)
 
     # Get list of all files in data directory
     data_files = [f for f in os.listdir("./data") if f.endswith(".csv")]
 
-    # Process files
-    for filename in data_files:
+    # Group chunk files by destination table. Chunks of one table have to be
+    # loaded in order (_01 drops the table, the rest append).
+    table_files = {}
+    for filename in sorted(data_files):
         base_name = filename.split(".")[0]
 
+        # Check if this is a numbered chunk file
+        if base_name.endswith(tuple("0123456789")) and "_" in base_name:
+            # Get the base table name without the chunk number
+            table_name = base_name.rsplit("_", 1)[0]
+            # If file ends in _01, truncate the table, otherwise append
+            write_disposition = "drop" if base_name.endswith("_01") else "append"
+        else:
+            # For non-chunked files, use the full base name and truncate
+            table_name = base_name
+            write_disposition = "drop"
+
+        table_files.setdefault(table_name, []).append((filename, write_disposition))
+
+    # Load one table at a time so only one CSV is held in memory
+    for table_name, files in table_files.items():
+        load_campaign_finance_table(table_name, files)
+
+
+def load_campaign_finance_table(table_name, files):
+    """
+    Load every CSV chunk of one campaign finance table into BigQuery, in order.
+
+    Args:
+        table_name (str): Base table name, without the campaign_finance_ prefix
+        files (list[tuple]): (filename, write_disposition) pairs in load order
+    """
+    for filename, write_disposition in files:
         try:
-            # Check if this is a numbered chunk file
-            if base_name.endswith(tuple("0123456789")) and "_" in base_name:
-                # Get the base table name without the chunk number
-                table_name = base_name.rsplit("_", 1)[0]
-                # If file ends in _01, truncate the table, otherwise append
-                write_disposition = "drop" if base_name.endswith("_01") else "append"
-            else:
-                # For non-chunked files, use the full base name and truncate
-                table_name = base_name
-                write_disposition = "drop"
-
             print(f"Processing {filename} into table {table_name}")
 
             # Read full CSV since dataframe_to_bigquery handles chunking
-            df = pd.read_csv(f"./data/{filename}", dtype=str)
+            df = read_csv_as_strings(f"./data/{filename}")
 
             dataframe_to_bigquery(
                 df=df,
@@ -5,7 +5,11 @@ import zipfile
 import pandas as pd
 import requests
 
-from pipelines.utils.utils import dataframe_to_bigquery, get_secret
+from pipelines.utils.utils import (
+    dataframe_to_bigquery,
+    get_secret,
+    read_csv_as_strings,
+)
 
 OUT_DATASET_NAME = "tx_leg_raw_bills"
 PROJECT_ID = get_secret(secret_id="GCP_PROJECT_ID")
@@ -41,18 +45,27 @@ data_files = [
 ]
 
 # Process files that match the pattern
-election_results_df = pd.DataFrame()
+election_results_frames = []
 for filename in data_files:
     if re.match("[0-9]+_General_Election_Returns.csv", filename):
         print(f"\nReading {filename}:")
-        df = pd.read_csv(f"./data/temp_data/election_results/{filename}")
+        # pyarrow's multithreaded reader is much faster than pandas' parser on
+        # these large files. Every column is read as a string so a file's
+        # values can't change the inferred types from one year to the next.
+        df = read_csv_as_strings(f"./data/temp_data/election_results/{filename}")
         # Extract year from filename
         year = int(filename.split("_")[0])
         # Add year and election_type columns
         df["year"] = year
         df["election_type"] = "General"
-        # Append to main dataframe
-        election_results_df = pd.concat([election_results_df, df], ignore_index=True)
+        election_results_frames.append(df)
+
+# Concatenate once rather than copying the growing frame on every file
+if election_results_frames:
+    election_results_df = pd.concat(election_results_frames, ignore_index=True)
+else:
+    print("No general election returns files found in the download")
+    election_results_df = pd.DataFrame()
 
 dataframe_to_bigquery(
     election_results_df,
@@ -62,4 +75,7 @@ dataframe_to_bigquery(
     env=ENV,
     write_disposition="drop",
     chunk_size=500000,
+    # The table is dropped and rewritten on every run, so it can take its
+    # schema from the Parquet chunks
+    as_parquet=True,
 )
@@ -1,4 +1,5 @@
 import atexit
+import csv
 import datetime
 import io
 import json
@@ -7,7 +8,9 @@ import os
 import re
 import subprocess
 import sys
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from ftplib import FTP
 from urllib.parse import urlparse
 
@@ -15,9 +18,11 @@ import dotenv
 import gspread
 import pandas as pd
 import pdfplumber
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import yaml
 from dotenv import load_dotenv
-from google.cloud import secretmanager
+from google.cloud import bigquery, secretmanager
 from gspread import SpreadsheetNotFound
 from parsons import GoogleBigQuery, Table
 from prefect import task
@@ -26,6 +31,19 @@ from prefect.cache_policies import NO_CACHE
 logger = logging.getLogger(__name__)
 load_dotenv()
 
+# libyaml's C loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsons-style write dispositions and their BigQuery load job equivalents
+BQ_WRITE_DISPOSITIONS = {
+    "append": bigquery.WriteDisposition.WRITE_APPEND,
+    "drop": bigquery.WriteDisposition.WRITE_TRUNCATE,
+    "truncate": bigquery.WriteDisposition.WRITE_TRUNCATE,
+    "fail": bigquery.WriteDisposition.WRITE_EMPTY,
+}
+# Object column contents that Arrow can write to Parquet as-is
+ARROW_OBJECT_TYPES = {"string", "empty", "integer", "floating", "boolean", "decimal"}
+
 ################################################################################
 # UTILITY CLASSES
 ################################################################################
@@ -200,6 +218,49 @@ class FtpConnection:
         print(f"Retrieving PDF text for {pdf_url}")
         return self._retry_on_disconnect(retrieve)
 
+    def imap(self, func, items, max_workers=4):
+        """
+        Call func(connection, item) for each item using several FTP connections.
+
+        An FTP control connection can only run one command at a time, so each
+        worker thread opens its own connection to the same host with the same
+        login. Results are yielded in item order as they become available, so
+        the caller can stop early. Closing the generator cancels the items
+        that have not started yet and closes the worker connections.
+
+        Args:
+            func: Function taking an FtpConnection and an item
+            items: Iterable of items to process
+            max_workers: Number of concurrent FTP connections (default 4)
+
+        Yields:
+            tuple: (result, error) for each item, in the same order as items.
+                error is the exception raised while connecting or by func, or
+                None if the item succeeded.
+        """
+        local = threading.local()
+        worker_connections = []
+
+        def run(item):
+            try:
+                if not hasattr(local, "connection"):
+                    connection = FtpConnection(
+                        self.host, self.username, self.password, self.timeout
+                    )
+                    worker_connections.append(connection)
+                    local.connection = connection
+                return func(local.connection, item), None
+            except Exception as e:
+                return None, e
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            yield from executor.map(run, items)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            for connection in worker_connections:
+                connection.close()
+
     def close(self):
         """Close the FTP connection"""
 
@@ -400,10 +461,10 @@ def upload_google_sheets(gsheets_config_path, config_path, env):
     """
 
     with open(gsheets_config_path, "r") as file:
-        gsheets_config = yaml.safe_load(file)
+        gsheets_config = yaml.load(file, Loader=YAML_LOADER)
 
     with open(config_path, "r") as file:
-        config = yaml.safe_load(file)
+        config = yaml.load(file, Loader=YAML_LOADER)
 
     # Validate required fields are present in config
     required_fields = [
@@ -500,6 +561,71 @@ def upload_google_sheets(gsheets_config_path, config_path, env):
             print(e)
 
 
+def read_csv_as_strings(path):
+    """
+    Read a CSV into a DataFrame with every column typed as a string.
+
+    Uses pyarrow's multithreaded C++ reader instead of pandas' parser, which
+    keeps peak memory much lower on large bulk files.
+
+    Args:
+        path (str): Path to the CSV file
+
+    Returns:
+        pandas.DataFrame: DataFrame with string (object) columns
+    """
+    # utf-8-sig drops a byte order mark, which pyarrow skips as well
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f))
+
+    table = pacsv.read_csv(
+        path,
+        # Quoted fields can span lines, as pd.read_csv allows
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            column_types={col: pa.string() for col in header},
+            strings_can_be_null=True,
+        ),
+    )
+    return table.to_pandas()
+
+
+def _dataframe_to_bigquery_parquet(
+    bq, df, table_name, destination, write_disposition, chunk_size
+):
+    """
+    Load a cleaned DataFrame as Parquet load jobs, one per chunk of rows.
+    """
+    if write_disposition not in BQ_WRITE_DISPOSITIONS:
+        raise ValueError(f"Invalid write disposition: {write_disposition}")
+
+    # Arrow can't write object columns holding mixed types, dicts or lists, so
+    # load those as strings, the same way they are written to CSV
+    for col in df.columns:
+        if df[col].dtype == object and (
+            pd.api.types.infer_dtype(df[col], skipna=True) not in ARROW_OBJECT_TYPES
+        ):
+            df[col] = df[col].map(lambda value: None if value is None else str(value))
+
+    total_rows = len(df)
+    for i in range(0, total_rows, chunk_size):
+        chunk_df = df.iloc[i : min(i + chunk_size, total_rows)]
+
+        print(
+            f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -- Loading chunk {i//chunk_size + 1} to {destination} as Parquet"
+        )
+        # First chunk uses write_disposition, subsequent chunks append
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            write_disposition=BQ_WRITE_DISPOSITIONS[
+                "append" if i > 0 else write_disposition
+            ],
+        )
+        bq.client.load_table_from_dataframe(
+            chunk_df, table_name, job_config=job_config
+        ).result()
+
+
 @task(
     retries=3,
     retry_delay_seconds=10,
@@ -517,9 +643,15 @@ def dataframe_to_bigquery(
     chunk_size=50000,
     allow_empty_table=False,
     log_upload=True,
+    as_parquet=False,
 ):
     """
     Load data to destination using Parsons BigQuery connector.
+
+    With as_parquet, each chunk is sent as a Parquet load job through the
+    BigQuery client instead of being staged as CSV in GCS. The table schema
+    then comes from the DataFrame's dtypes rather than CSV autodetection, so
+    only use it for tables that are dropped and reloaded in full.
     """
 
     if df is None:
@@ -565,28 +697,33 @@ def dataframe_to_bigquery(
     # Split dataframe into chunks of 100k rows
     total_rows = len(df)
 
-    for i in range(0, total_rows, chunk_size):
-        chunk_df = df.iloc[i : min(i + chunk_size, total_rows)]
-        tbl = Table.from_dataframe(chunk_df)
-        print(tbl)
-
-        print(
-            f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -- Loading chunk {i//chunk_size + 1} to {destination} using Parsons"
-        )
-        # Load data to BigQuery using Parsons
-        bq.copy(
-            tbl,
-            table_name=table_name,
-            if_exists=(
-                "append" if i > 0 else write_disposition
-            ),  # First chunk uses write_disposition, subsequent chunks append
-            tmp_gcs_bucket=get_secret(
-                secret_id="GCS_TEMP_BUCKET"
-            ),  # Replace with your GCS bucket
+    if as_parquet:
+        _dataframe_to_bigquery_parquet(
+            bq, df, table_name, destination, write_disposition, chunk_size
         )
+    else:
+        for i in range(0, total_rows, chunk_size):
+            chunk_df = df.iloc[i : min(i + chunk_size, total_rows)]
+            tbl = Table.from_dataframe(chunk_df)
+            print(tbl)
+
+            print(
+                f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -- Loading chunk {i//chunk_size + 1} to {destination} using Parsons"
+            )
+            # Load data to BigQuery using Parsons
+            bq.copy(
+                tbl,
+                table_name=table_name,
+                if_exists=(
+                    "append" if i > 0 else write_disposition
+                ),  # First chunk uses write_disposition, subsequent chunks append
+                tmp_gcs_bucket=get_secret(
+                    secret_id="GCS_TEMP_BUCKET"
+                ),  # Replace with your GCS bucket
+            )
 
     logger.info(
-        f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -- Loaded {tbl.num_rows} rows to {destination}"
+        f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -- Loaded {total_rows} rows to {destination}"
     )
 
     if log_upload:
@@ -670,17 +807,11 @@ def dataframe_to_duckdb(df, duckdb_conn, dataset_id, table_id, env, write_dispos
         duckdb_conn.sql(f"DROP TABLE IF EXISTS {destination}")
         duckdb_conn.sql(f"CREATE TABLE {destination} AS SELECT * FROM df")
     elif write_disposition.lower() == "append":
-        # check if table exists
-        if (
-            duckdb_conn.sql(
-                f"SELECT * FROM information_schema.tables WHERE table_schema = '{dataset_name}' AND table_name = '{table_name}'"
-            )
-            .df()
-            .empty
-        ):
-            duckdb_conn.sql(f"CREATE TABLE {destination} AS SELECT * FROM df")
-        else:
-            duckdb_conn.sql(f"INSERT INTO {destination} SELECT * FROM df")
+        # create an empty table with df's schema if needed, then always insert
+        duckdb_conn.sql(
+            f"CREATE TABLE IF NOT EXISTS {destination} AS SELECT * FROM df LIMIT 0"
+        )
+        duckdb_conn.sql(f"INSERT INTO {destination} SELECT * FROM df")
     elif write_disposition.lower() == "fail":
         raise ValueError(f"Table {destination} already exists")
     else:
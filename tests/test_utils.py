@@ -0,0 +1,20 @@
+from pipelines.utils.utils import read_csv_as_strings
+
+
+def test_read_csv_as_strings_keeps_quoted_newlines(tmp_path):
+    path = tmp_path / "contributions.csv"
+    path.write_text(
+        "filerIdent,contributorStreetAddr,amount\n"
+        '00012345,"123 Main St\nSuite 4",0100.00\n'
+        "00067890,,25\n"
+    )
+
+    df = read_csv_as_strings(path)
+
+    assert len(df) == 2
+    assert df["contributorStreetAddr"][0] == "123 Main St\nSuite 4"
+    # Every column stays a string, so leading zeros survive
+    assert df["filerIdent"].tolist() == ["00012345", "00067890"]
+    assert df["amount"].tolist() == ["0100.00", "25"]
+    # Empty fields are null rather than empty strings
+    assert df["contributorStreetAddr"].isna()[1]